@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Measure import time of okane with `python -X importtime`, and fail if it exceeds a budget
+
+Each measurement runs in a fresh interpreter; the minimum over the runs is reported together
+with the slowest top-level imports of that run. Optional dependencies (pandas, pyarrow, openpyxl)
+must not be imported, they are imported by the functions which need them.
+
+Usage: python benchmarks/bench_import.py [--runs 5] [--budget 500]
+"""
+
+import argparse
+import os.path as op
+import subprocess
+import sys
+
+ROOT = op.join(op.dirname(__file__), "..")
+
+
+def measure() -> tuple[int, list[tuple[int, str]]]:
+    """Return cumulative import time of okane and (time, name) of its top-level imports, in microseconds"""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import okane"], cwd=ROOT,
+                            check=True, capture_output=True, text=True).stderr
+    total = 0
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == "okane":
+            total = int(cumulative)
+        elif name.startswith("   ") and not name.startswith("    "):
+            imports.append((int(cumulative), name.strip()))
+    return total, sorted(imports, reverse=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="number of measurements (default: 5)")
+    parser.add_argument("--budget", type=float, default=500, help="maximum import time in ms (default: 500)")
+    args = parser.parse_args()
+
+    total, imports = min(measure() for _ in range(args.runs))
+    print(f"import okane: {total / 1000:.1f} ms (budget {args.budget:.0f} ms)")
+    for cumulative, name in imports[:10]:
+        print(f"  {name:30} {cumulative / 1000:8.1f} ms")
+
+    if total / 1000 > args.budget:
+        print("import time is over budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Measure per-entry cost of `parse_transaction_row()`, `parse_transaction()` and `LazyTransaction`
+
+The XML tree is parsed beforehand, so only the extraction of values from `Ntry` is measured.
+
+Usage: python benchmarks/bench_parse_transaction.py [NUM_ENTRIES]
+"""
+
+import os.path as op
+import sys
+import tempfile
+import timeit
+
+from lxml import etree
+
+sys.path.insert(0, op.join(op.dirname(__file__), ".."))
+import okane  # noqa: E402
+from generate import generate_file  # noqa: E402
+
+
+def main() -> None:
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = op.join(tmpdir, "statement.xml")
+        generate_file(path, num_entries)
+        root = etree.parse(path).getroot()
+
+    entries = okane.findall(okane.get_element(root, "BkToCstmrStmt/Stmt"), "Ntry")
+    n = len(entries)
+
+    cases = {
+        "parse_transaction_row": lambda: [okane.parse_transaction_row(ntry) for ntry in entries],
+        "parse_transaction": lambda: [okane.parse_transaction(ntry) for ntry in entries],
+        "LazyTransaction (3 fields)": lambda: [(tx.amount, tx.val_date, tx.entry_ref)
+                                               for tx in map(okane.LazyTransaction, entries)],
+        "LazyTransaction (all fields)": lambda: [(tx.amount, tx.val_date, tx.entry_ref, tx.ref, tx.info,
+                                                  tx.related_account)
+                                                 for tx in map(okane.LazyTransaction, entries)],
+    }
+
+    for name, func in cases.items():
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:35}  {n} entries  {t / n * 1e6:.1f} us/entry")
+
+
+if __name__ == "__main__":
+    main()
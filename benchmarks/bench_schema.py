@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Measure cost of XSD validation (`from_file(path, validate_schema=True)`) compared with the plain parse
+
+Uses the bundled camt.053.001.02 XSD schema, or the one in `OKANE_SCHEMA_DIR`, see `okane.schema_path()`.
+
+Usage: python benchmarks/bench_schema.py [NUM_ENTRIES]
+"""
+
+import os.path as op
+import sys
+import tempfile
+import timeit
+
+from lxml import etree
+
+sys.path.insert(0, op.join(op.dirname(__file__), ".."))
+import okane  # noqa: E402
+from generate import generate_file  # noqa: E402
+
+
+def main() -> None:
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = op.join(tmpdir, "statement.xml")
+        generate_file(path, num_entries)
+
+        t0 = timeit.default_timer()
+        with open(path, "rb") as fp:
+            schema = okane.load_schema(okane.read_namespace(fp))
+        print(f"{'compile schema (once per process)':40}  {timeit.default_timer() - t0:.3f} s")
+
+        tree = etree.parse(path)
+        cases = {
+            "etree.parse": lambda: etree.parse(path),
+            "schema.assertValid (parsed tree)": lambda: schema.assertValid(tree),
+            "from_file": lambda: okane.BankToCustomerStatement.from_file(path),
+            "from_file(validate_schema=True)": lambda: okane.BankToCustomerStatement.from_file(
+                path, validate_schema=True),
+            "parse_to_columns": lambda: okane.parse_to_columns(path),
+            "parse_to_columns(validate_schema=True)": lambda: okane.parse_to_columns(path, validate_schema=True),
+        }
+
+        # cache hits, the file is validated only by the first call
+        cache = okane.Cache(op.join(tmpdir, "cache"))
+        cache.parse(path, validate_schema=True)
+        cases["Cache.parse (hit)"] = lambda: cache.parse(path)
+        cases["Cache.parse(validate_schema=True) (hit)"] = lambda: cache.parse(path, validate_schema=True)
+
+        for name, func in cases.items():
+            t = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{name:40}  {num_entries} entries  {t / num_entries * 1e6:.1f} us/entry")
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Measure per-entry cost of JSON serialization: per-statement `model_dump_json()` (`--format json`)
+versus one transaction per line with `TRANSACTION_ADAPTER` (`--format ndjson`)
+
+The statement is parsed beforehand, so only serialization is measured.
+
+Usage: python benchmarks/bench_serialize.py [NUM_ENTRIES]
+"""
+
+import os.path as op
+import sys
+import tempfile
+import timeit
+from io import BytesIO
+
+sys.path.insert(0, op.join(op.dirname(__file__), ".."))
+import okane  # noqa: E402
+from generate import generate_file  # noqa: E402
+
+
+def write(output_format: okane.OutputFormat, statement: okane.BankToCustomerStatement, **kwargs) -> int:
+    fp = BytesIO()
+    writer = okane.StatementWriter.for_format(output_format, fp, **kwargs)
+    writer.write(statement)
+    writer.close()
+    return len(fp.getvalue())
+
+
+def main() -> None:
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = op.join(tmpdir, "statement.xml")
+        generate_file(path, num_entries)
+        statement = okane.BankToCustomerStatement.from_file(path)
+
+    n = len(statement.transactions)
+    cases = {
+        "json (indent=4)": lambda: write(okane.OutputFormat.JSON, statement, indent=4),
+        "json (no indent)": lambda: write(okane.OutputFormat.JSON, statement),
+        "ndjson": lambda: write(okane.OutputFormat.NDJSON, statement),
+        "tx.model_dump_json()": lambda: sum(len(tx.model_dump_json()) for tx in statement.transactions),
+    }
+
+    for name, func in cases.items():
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:25}  {n} entries  {t / n * 1e6:.2f} us/entry  {func() / n:.0f} bytes/entry")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Compare parsing with and without Pydantic validation of the statement (`validate=False`, "trusted" mode)
+
+Transactions are validated in both modes, see `okane.parse_statement()`.
+
+Usage: python benchmarks/bench_validate.py [NUM_ENTRIES]
+"""
+
+import os.path as op
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, op.join(op.dirname(__file__), ".."))
+import okane  # noqa: E402
+from generate import generate_file  # noqa: E402
+
+
+def main() -> None:
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = op.join(tmpdir, "statement.xml")
+        generate_file(path, num_entries)
+        n = len(okane.BankToCustomerStatement.from_file(path).transactions)
+
+        for validate in [True, False]:
+            t = min(timeit.repeat(lambda: okane.BankToCustomerStatement.from_file(path, validate=validate),
+                                  number=1, repeat=3))
+            print(f"validate={validate!s:5}  {n} entries  {t:.3f} s  {n / t:,.0f} entries/s  {t / n * 1e6:.1f} us/entry")
+
+
+if __name__ == "__main__":
+    main()
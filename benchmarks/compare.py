@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Compare two benchmark result files produced by `run.py`
+
+Prints throughput and peak memory of each case in both files and their ratio.
+
+Usage: python benchmarks/compare.py OLD.json NEW.json [--threshold 0.1]
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+
+def load(path: str) -> tuple[str, dict[tuple[str, int], dict[str, Any]]]:
+    with open(path, encoding="utf-8") as fp:
+        data = json.load(fp)
+    # runs of the same version are told apart by the commit (missing in older result files)
+    label = " ".join(filter(None, [data["okane_version"], data.get("git_commit")]))
+    return label, {(r["case"], r["entries"]): r for r in data["results"]}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="report throughput drop larger than this as regression (default: 0.1)")
+    args = parser.parse_args()
+
+    old_version, old = load(args.old)
+    new_version, new = load(args.new)
+    regressions = 0
+
+    print(f"{'case':20} {'entries':>9}  {old_version:>14}  {new_version:>14}  {'speedup':>7}  "
+          f"{'old MB':>8}  {'new MB':>8}")
+    for key in sorted(old.keys() & new.keys()):
+        o, n = old[key], new[key]
+        speedup = n["entries_per_second"] / o["entries_per_second"]
+        regression = speedup < 1 - args.threshold
+        regressions += regression
+        print(f"{key[0]:20} {key[1]:>9}  {o['entries_per_second']:>12,.0f}/s  {n['entries_per_second']:>12,.0f}/s  "
+              f"{speedup:6.2f}x  {o['peak_rss_mb'] or 0:8.1f}  {n['peak_rss_mb'] or 0:8.1f}"
+              f"{'  REGRESSION' if regression else ''}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic camt.053 statements in ČBA dialect, for benchmarks
+
+The output is deterministic for given number of entries and seed. Entries mix
+credits/debits, `DbtrAcct`/`CdtrAcct` related parties with IBAN or `Othr/Id`
+account codes, BIC or `Othr/Id` bank codes, and several `Refs` variants
+(domestic payment, SEPA credit transfer, SEPA direct debit, card transaction).
+Closing balance equals opening balance plus sum of the entries.
+
+Usage: python benchmarks/generate.py NUM_ENTRIES -o statement.xml [--seed SEED]
+"""
+
+import argparse
+import datetime
+import random
+from typing import Iterator, TextIO
+
+NAMESPACE = "urn:iso:std:iso:20022:tech:xsd:camt.053.001.02"
+FROM_DATE = datetime.date(2023, 3, 1)
+TO_DATE = datetime.date(2023, 3, 31)
+
+REFS_VARIANTS = [
+    # domestic payment
+    "<MsgId>{n}</MsgId><AcctSvcrRef>{n:010d}</AcctSvcrRef><InstrId>PT{n}</InstrId><EndToEndId>{vs}</EndToEndId>",
+    # SEPA credit transfer
+    "<MsgId>{n}</MsgId><AcctSvcrRef>{n:010d}</AcctSvcrRef><InstrId>MCCT{n:012d}</InstrId>"
+    "<EndToEndId>E2E{n:012d}</EndToEndId>",
+    # SEPA direct debit
+    "<MsgId>{n}</MsgId><AcctSvcrRef>{n:010d}</AcctSvcrRef><EndToEndId>E2E{n:012d}</EndToEndId>"
+    "<MndtId>MNDT{vs}</MndtId>",
+    # card transaction
+    "<MsgId>{n}</MsgId><AcctSvcrRef>{n:010d}</AcctSvcrRef><PmtInfId>{vs}</PmtInfId>"
+    "<ChqNb>xxxxxxxxxxxx{card:04d}</ChqNb><ClrSysRef>card payment</ClrSysRef>",
+    # account servicer reference only
+    "<AcctSvcrRef>{n:010d}</AcctSvcrRef>",
+]
+
+HEADER = """\
+<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Document xmlns="{namespace}">
+<BkToCstmrStmt>
+<GrpHdr><MsgId>camt.053-{to_date}-001</MsgId><CreDtTm>{to_date}T12:00:00.000+02:00</CreDtTm>
+<MsgPgntn><PgNb>1</PgNb><LastPgInd>true</LastPgInd></MsgPgntn><AddtlInf>Měsíční</AddtlInf></GrpHdr>
+<Stmt>
+<Id>GENERATED-{seed}-{num_entries}</Id><ElctrncSeqNb>1</ElctrncSeqNb><LglSeqNb>1</LglSeqNb>
+<CreDtTm>{to_date}T12:00:00.000+02:00</CreDtTm>
+<FrToDt><FrDtTm>{from_date}T00:00:00.000+01:00</FrDtTm><ToDtTm>{to_date}T23:59:59.999+02:00</ToDtTm></FrToDt>
+<Acct><Id><IBAN>CZ6508000000192000145399</IBAN></Id><Tp><Cd>CASH</Cd></Tp><Ccy>CZK</Ccy><Nm>John Doe</Nm>
+<Svcr><FinInstnId><BIC>GIBACZPX</BIC><Othr><Id>0800</Id></Othr></FinInstnId></Svcr></Acct>
+<Bal><Tp><CdOrPrtry><Cd>PRCD</Cd></CdOrPrtry></Tp><Amt Ccy="CZK">{opening_amount}</Amt>
+<CdtDbtInd>{opening_cdi}</CdtDbtInd><Dt><Dt>{from_date}</Dt></Dt></Bal>
+<Bal><Tp><CdOrPrtry><Cd>CLBD</Cd></CdOrPrtry></Tp><Amt Ccy="CZK">{closing_amount}</Amt>
+<CdtDbtInd>{closing_cdi}</CdtDbtInd><Dt><Dt>{to_date}</Dt></Dt></Bal>
+<TxsSummry><TtlCdtNtries><NbOfNtries>{num_credits}</NbOfNtries><Sum>{sum_credits}</Sum></TtlCdtNtries>
+<TtlDbtNtries><NbOfNtries>{num_debits}</NbOfNtries><Sum>{sum_debits}</Sum></TtlDbtNtries></TxsSummry>
+"""
+
+ENTRY = """\
+<Ntry><NtryRef>{entry_ref}</NtryRef><Amt Ccy="CZK">{amount}</Amt><CdtDbtInd>{cdi}</CdtDbtInd>
+<RvslInd>false</RvslInd><Sts>BOOK</Sts><BookgDt><Dt>{date}</Dt></BookgDt><ValDt><Dt>{date}</Dt></ValDt>
+<BkTxCd><Prtry><Cd>{tx_code}</Cd><Issr>CBA</Issr></Prtry></BkTxCd>
+<NtryDtls><TxDtls><Refs>{refs}</Refs>
+<AmtDtls><TxAmt><Amt Ccy="CZK">{amount}</Amt></TxAmt></AmtDtls>
+<BkTxCd><Prtry><Cd>{tx_code}</Cd><Issr>CBA</Issr></Prtry></BkTxCd>{related}
+<RmtInf><Ustrd>{remote_info}</Ustrd></RmtInf>{additional_info}</TxDtls></NtryDtls></Ntry>
+"""
+
+FOOTER = """\
+</Stmt>
+</BkToCstmrStmt>
+</Document>
+"""
+
+
+def format_amount(cents: int) -> str:
+    return f"{abs(cents) // 100}.{abs(cents) % 100:02d}"
+
+
+def iter_entries(num_entries: int, seed: int) -> Iterator[tuple[str, int]]:
+    """Yield `(entry_xml, amount_in_cents)` for each entry"""
+    rng = random.Random(seed)
+    num_days = (TO_DATE - FROM_DATE).days + 1
+
+    for n in range(1, num_entries + 1):
+        credit = rng.random() < 0.3
+        cents = rng.randint(100, 5_000_000) if credit else -rng.randint(100, 500_000)
+        date = FROM_DATE + datetime.timedelta(days=(n - 1) * num_days // num_entries)
+        vs = rng.randint(1, 9_999_999_999)
+        refs = rng.choice(REFS_VARIANTS).format(n=n, vs=vs, card=rng.randint(0, 9999))
+
+        related = ""
+        if rng.random() < 0.85:
+            party, agent = ("Dbtr", "DbtrAgt") if credit else ("Cdtr", "CdtrAgt")
+            if rng.random() < 0.5:
+                account_id = f"<IBAN>CZ{rng.randint(10, 99)}{rng.randint(0, 10**20 - 1):020d}</IBAN>"
+                bank_id = f"<BIC>{rng.choice(['GIBACZPX', 'KOMBCZPP', 'CEKOCZPP', 'FIOBCZPP', 'REVOLT21'])}</BIC>"
+            else:
+                account_id = f"<Othr><Id>{rng.randint(0, 999999):06d}-{rng.randint(10**9, 10**10 - 1)}</Id></Othr>"
+                bank_id = f"<Othr><Id>{rng.choice(['0100', '0300', '0800', '2010', '5500'])}</Id></Othr>"
+            related = (f"\n<RltdPties><{party}><Nm>Counterparty {n % 1000}</Nm></{party}>"
+                       f"<{party}Acct><Id>{account_id}</Id></{party}Acct></RltdPties>"
+                       f"\n<RltdAgts><{agent}><FinInstnId>{bank_id}</FinInstnId></{agent}></RltdAgts>")
+
+        additional_info = ""
+        if rng.random() < 0.5:
+            additional_info = f"\n<AddtlTxInf>{'Příchozí' if credit else 'Odchozí'} platba {n}</AddtlTxInf>"
+
+        yield ENTRY.format(
+            entry_ref=f"GEN-REF-{n}",
+            amount=format_amount(cents),
+            cdi="CRDT" if credit else "DBIT",
+            date=date.isoformat(),
+            tx_code=rng.choice(["10000405000", "20000405000", "30000405000"]),
+            refs=refs,
+            related=related,
+            remote_info=f"VS {vs} platba č. {n}",
+            additional_info=additional_info,
+        ), cents
+
+
+def generate_statement(fp: TextIO, num_entries: int, seed: int = 0) -> None:
+    """Write generated statement with `num_entries` entries to text file"""
+    # entries are generated twice to keep memory use constant, since the header needs totals
+    num_credits = num_debits = sum_credits = sum_debits = 0
+    for _, cents in iter_entries(num_entries, seed):
+        if cents > 0:
+            num_credits += 1
+            sum_credits += cents
+        else:
+            num_debits += 1
+            sum_debits += cents
+
+    opening_cents = 100_000_00
+    closing_cents = opening_cents + sum_credits + sum_debits
+
+    fp.write(HEADER.format(
+        namespace=NAMESPACE,
+        seed=seed,
+        num_entries=num_entries,
+        from_date=FROM_DATE.isoformat(),
+        to_date=TO_DATE.isoformat(),
+        opening_amount=format_amount(opening_cents),
+        opening_cdi="CRDT" if opening_cents >= 0 else "DBIT",
+        closing_amount=format_amount(closing_cents),
+        closing_cdi="CRDT" if closing_cents >= 0 else "DBIT",
+        num_credits=num_credits,
+        sum_credits=format_amount(sum_credits),
+        num_debits=num_debits,
+        sum_debits=format_amount(sum_debits),
+    ))
+    for entry, _ in iter_entries(num_entries, seed):
+        fp.write(entry)
+    fp.write(FOOTER)
+
+
+def generate_file(path: str, num_entries: int, seed: int = 0) -> None:
+    """Write generated statement with `num_entries` entries to given path"""
+    with open(path, "w", encoding="utf-8") as fp:
+        generate_statement(fp, num_entries, seed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("num_entries", type=int, help="number of Ntry elements")
+    parser.add_argument("--output", "-o", required=True, help="path to output XML file")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    args = parser.parse_args()
+
+    generate_file(args.output, args.num_entries, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for okane
+
+Measures throughput (entries/s) and peak memory (max RSS) of parsing and exporting
+generated statements (see `generate.py`) of several sizes. Each measurement runs
+in a fresh process, so that peak memory of one case does not affect the others.
+
+Results are stored as JSON (by default in `benchmarks/results/<okane version>-<git commit>-<timestamp>.json`,
+so that runs do not overwrite each other), compare two result files with `compare.py`.
+
+Usage:
+    python benchmarks/run.py [--sizes 1000 100000 1000000] [--cases from_file cli-json ...]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import os.path as op
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+sys.path.insert(0, op.join(op.dirname(__file__), ".."))
+import okane  # noqa: E402
+from generate import generate_file  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+DEFAULT_DATA_DIR = op.join(op.dirname(__file__), ".data")
+DEFAULT_RESULTS_DIR = op.join(op.dirname(__file__), "results")
+
+
+def case_from_file(path: str) -> float:
+    t0 = time.perf_counter()
+    okane.BankToCustomerStatement.from_file(path)
+    return time.perf_counter() - t0
+
+
+def case_parse_transactions(path: str) -> float:
+    from lxml import etree
+    stmt = okane.get_element(etree.parse(path).getroot(), "BkToCstmrStmt/Stmt")
+    t0 = time.perf_counter()
+    okane.parse_transactions(stmt)
+    return time.perf_counter() - t0
+
+
+def case_as_dataframe(path: str) -> float:
+    statement = okane.BankToCustomerStatement.from_file(path)
+    t0 = time.perf_counter()
+    statement.as_dataframe()
+    return time.perf_counter() - t0
+
+
+def make_cli_case(output_format: okane.OutputFormat) -> Callable[[str], float]:
+    def case_cli(path: str) -> float:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            t0 = time.perf_counter()
+            okane.main([path, "-f", output_format.value, "-o", op.join(tmpdir, "output")])
+            return time.perf_counter() - t0
+    return case_cli
+
+
+CASES: dict[str, Callable[[str], float]] = {
+    "from_file": case_from_file,
+    "parse_transactions": case_parse_transactions,
+    "as_dataframe": case_as_dataframe,
+    **{f"cli-{fmt.value}": make_cli_case(fmt) for fmt in okane.OutputFormat},
+}
+
+
+def max_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return max_rss / 1024**2 if sys.platform == "darwin" else max_rss / 1024
+
+
+def run_child(case: str, path: str) -> None:
+    seconds = CASES[case](path)
+    print(json.dumps({"seconds": seconds, "peak_rss_mb": max_rss_mb()}))
+
+
+def run_case(case: str, path: str, num_entries: int) -> dict[str, object]:
+    output = subprocess.run([sys.executable, __file__, "--child", case, path],
+                            check=True, capture_output=True, text=True).stdout
+    result = json.loads(output.splitlines()[-1])
+    return {
+        "case": case,
+        "entries": num_entries,
+        "seconds": result["seconds"],
+        "entries_per_second": num_entries / result["seconds"],
+        "peak_rss_mb": result["peak_rss_mb"],
+    }
+
+
+def git_commit() -> str | None:
+    """Return short hash of the checked out commit, None if it cannot be determined"""
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=op.dirname(op.abspath(__file__)),
+                                check=True, capture_output=True, text=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.strip() or None
+
+
+def get_input_file(data_dir: str, num_entries: int) -> str:
+    path = op.join(data_dir, f"generated-{num_entries}.xml")
+    if not op.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        print(f"Generating {path}", file=sys.stderr)
+        generate_file(path + ".tmp", num_entries)
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help=f"number of entries of input statements (default: {DEFAULT_SIZES})")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES),
+                        help="cases to run (default: all)")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR,
+                        help="directory for generated input files, reused between runs")
+    parser.add_argument("--output", "-o", help="path to output JSON file "
+                        "(default: benchmarks/results/<okane version>-<git commit>-<timestamp>.json)")
+    parser.add_argument("--child", nargs=2, metavar=("CASE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    results = []
+    for num_entries in args.sizes:
+        path = get_input_file(args.data_dir, num_entries)
+        for case in args.cases:
+            result = run_case(case, path, num_entries)
+            results.append(result)
+            print(f"{case:20} {num_entries:>9} entries  {result['seconds']:8.3f} s  "
+                  f"{result['entries_per_second']:>10,.0f} entries/s  {result['peak_rss_mb'] or 0:8.1f} MB",
+                  file=sys.stderr)
+
+    timestamp = datetime.datetime.now()
+    commit = git_commit()
+    output_path = args.output or op.join(
+        DEFAULT_RESULTS_DIR, f"{okane.__version__}-{commit or 'unknown'}-{timestamp:%Y%m%dT%H%M%S}.json")
+    os.makedirs(op.dirname(op.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as fp:
+        json.dump({
+            "okane_version": okane.__version__,
+            "git_commit": commit,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": timestamp.isoformat(timespec="seconds"),
+            "results": results,
+        }, fp, indent=4)
+    print(f"Results written to {output_path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
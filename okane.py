@@ -29,32 +29,94 @@ used by the Czech Banking Association (ČBA).
 
 """
 
-import argparse
+import bisect
+import bz2
+import csv
+import dataclasses
+import fnmatch
+import functools
+import gzip
+import hashlib
+import io
+import itertools
+import json
+import lzma
+import mmap
+import os
+import pickle
+import re
+import sqlite3
 import sys
-from typing import Optional, Any
+import time
+import tracemalloc
+import zlib
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Any, ContextManager, AsyncIterable, Protocol, AsyncIterator, Iterator, Iterable, Callable, ClassVar, Generic, TypeVar, BinaryIO, cast, get_args, overload
 from lxml import etree
 from lxml.etree import _Element
-from io import BytesIO, StringIO
-from pydantic import BaseModel
+from contextlib import contextmanager, nullcontext
+from pydantic import BaseModel, TypeAdapter
 from enum import Enum
 import datetime
 from decimal import Decimal
 import warnings
-try:
+if TYPE_CHECKING:
+    # optional dependencies are imported on first use, in the functions which need them
+    import asyncio
+    import numpy as np
     import pandas as pd
-except ImportError:
-    pd = None  # type: ignore[assignment]
+    import pyarrow as pa  # type: ignore[import-untyped]
 
 
 __version__ = "0.2.0"
 
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+
+# objects supporting the buffer protocol accepted by `BankToCustomerStatement.from_buffer()`
+BufferLike = bytes | bytearray | memoryview | mmap.mmap
+# paths to input files, `str` or eg. `pathlib.Path`
+StrPath = str | os.PathLike[str]
+
+
+def get_namespace(e: _Element) -> str | None:
+    """Return namespace URI of the element, eg. `urn:iso:std:iso:20022:tech:xsd:camt.053.001.02`"""
+    tag = e.tag
+    if isinstance(tag, str) and tag.startswith("{"):
+        return tag[1:tag.index("}")]
+    else:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def qualify_path(path: str, namespace: str | None) -> str:
+    """Put each tag in the (relative, ElementPath) path in given namespace"""
+    if namespace is None:
+        return path
+    else:
+        return "/".join(f"{{{namespace}}}{tag}" for tag in path.split("/"))
+
+
+def find(e: _Element, path: str) -> _Element | None:
+    """Like `e.find(path)`, with tags in `path` taken to be in the namespace of `e`"""
+    return e.find(qualify_path(path, get_namespace(e)))
+
+
+def findall(e: _Element, path: str) -> list[_Element]:
+    """Like `e.findall(path)`, with tags in `path` taken to be in the namespace of `e`"""
+    return e.findall(qualify_path(path, get_namespace(e)))
+
 
 def get_text_or_none(e: _Element | None, path: str | None = None, strip: bool = True) -> str | None:
     if e is None:
         return None
     else:
         if path is not None:
-            e = e.find(path)
+            e = find(e, path)
 
         if e is None:
             return None
@@ -73,7 +135,7 @@ def get_text(e: _Element | None, path: str | None = None, strip: bool = True) ->
 
 
 def get_element(root: _Element, path: str) -> _Element:
-    e = root.find(path)
+    e = find(root, path)
     if e is None:
         raise ValueError(f"Missing mandatory element ({path})")
     return e
@@ -84,6 +146,73 @@ def get_attribute(e: _Element, attr: str) -> str:
     return str(value)
 
 
+#: Maps tag to name of the element, or to table for its children, see `collect_elements()`
+ElementTable = dict[str, "str | ElementTable"]
+
+
+def collect_elements(root: _Element, table: ElementTable,
+                     found: dict[str, _Element] | None = None) -> dict[str, _Element]:
+    """
+    Find elements described by `table` in one pass over the subtree
+
+    This is like calling `root.find(path)` for each path in the table, but the subtree
+    is walked only once, descending only into elements that lead to something in the table.
+    Like with `find()`, the first matching element in document order is returned for each path.
+
+    Args:
+        root: element to search
+        table: tags qualified with namespace, see `qualify_table()`
+        found: dictionary to add the results to
+
+    Returns:
+        Dictionary mapping names from table to found elements
+    """
+    if found is None:
+        found = {}
+    for child in root:
+        target = table.get(child.tag)
+        if target is None:
+            continue
+        elif isinstance(target, str):
+            if target not in found:
+                found[target] = child
+        else:
+            collect_elements(child, target, found)
+    return found
+
+
+@functools.lru_cache(maxsize=None)
+def qualify_table(name: str, namespace: str | None) -> ElementTable:
+    """Return `ELEMENT_TABLES[name]` with tags put in given namespace"""
+    def qualify(table: ElementTable) -> ElementTable:
+        return {qualify_path(tag, namespace): target if isinstance(target, str) else qualify(target)
+                for tag, target in table.items()}
+
+    return qualify(ELEMENT_TABLES[name])
+
+
+def bank_id_values(root: _Element) -> tuple[str | None, str | None]:
+    """Return `(bic, id)` from `FinInstnId` element, or `(None, None)` if neither is present"""
+    found = collect_elements(root, qualify_table("FinInstnId", get_namespace(root)))
+    bic = get_text_or_none(found.get("bic")) or get_text_or_none(found.get("bicfi"))
+    id = get_text_or_none(found.get("id"))
+    return (bic, id) if bic or id else (None, None)
+
+
+def account_id_values(root: _Element) -> tuple[str | None, str | None]:
+    """Return `(iban, id)` from account `Id` element, or `(None, None)` if neither is present"""
+    found = collect_elements(root, qualify_table("AccountId", get_namespace(root)))
+    iban = get_text_or_none(found.get("iban"))
+    id = get_text_or_none(found.get("id"))
+    return (iban, id) if iban or id else (None, None)
+
+
+def transaction_ref_values(root: _Element) -> tuple[str | None, ...]:
+    """Return values of `TransactionRef` fields from `Refs` element, in order of the fields"""
+    found = collect_elements(root, qualify_table("Refs", get_namespace(root)))
+    return tuple(get_text_or_none(found.get(name)) for name in TransactionRef.XML_TAGS)
+
+
 class CreditOrDebit(str, Enum):
     """CreditDebitCode per camt.053"""
     CRDT = "CRDT"
@@ -106,8 +235,7 @@ class BankId(BaseModel):
 
     @classmethod
     def from_xml(cls, root: _Element) -> Optional["BankId"]:
-        bic = get_text_or_none(root, "BIC") or get_text_or_none(root, "BICFI")
-        id = get_text_or_none(root, "Othr/Id")
+        bic, id = bank_id_values(root)
 
         if bic or id:
             return cls(
@@ -134,8 +262,7 @@ class AccountId(BaseModel):
 
     @classmethod
     def from_xml(cls, root: _Element) -> Optional["AccountId"]:
-        iban = get_text_or_none(root, "IBAN")
-        id = get_text_or_none(root, "Othr/Id")
+        iban, id = account_id_values(root)
 
         if iban or id:
             return cls(
@@ -156,6 +283,18 @@ class TransactionRef(BaseModel):
     cheque_number: str | None = None
     clearing_system_ref: str | None = None
 
+    #: XML tag for each of the fields, in order of the fields
+    XML_TAGS: ClassVar[dict[str, str]] = {
+        "message_id": "MsgId",
+        "end_to_end_id": "EndToEndId",
+        "account_servicer_ref": "AcctSvcrRef",
+        "payment_invocation_id": "PmtInfId",
+        "instruction_id": "InstrId",
+        "mandate_id": "MndtId",
+        "cheque_number": "ChqNb",
+        "clearing_system_ref": "ClrSysRef",
+    }
+
     def __str__(self) -> str:
         return ", ".join(f"{k}={v}" for k, v in self.model_dump().items() if v is not None)
 
@@ -164,16 +303,7 @@ class TransactionRef(BaseModel):
         if root is None:
             return cls()
         else:
-            return cls(
-                message_id=get_text_or_none(root, "MsgId"),
-                account_servicer_ref=get_text_or_none(root, "AcctSvcrRef"),
-                payment_invocation_id=get_text_or_none(root, "PmtInfId"),
-                instruction_id=get_text_or_none(root, "InstrId"),
-                end_to_end_id=get_text_or_none(root, "EndToEndId"),
-                mandate_id=get_text_or_none(root, "MndtId"),
-                cheque_number=get_text_or_none(root, "ChqNb"),
-                clearing_system_ref=get_text_or_none(root, "ClrSysRef"),
-            )
+            return cls(**dict(zip(cls.XML_TAGS, transaction_ref_values(root))))
 
 
 class Balance(BaseModel):
@@ -182,19 +312,21 @@ class Balance(BaseModel):
     date: datetime.date
 
 
-class Transaction(BaseModel):
-    ref: TransactionRef
-    entry_ref: str
-    amount: Decimal
-    currency: str
-    val_date: datetime.date
-    remote_info: str | None
-    additional_transaction_info: str | None
-    related_account_id: AccountId | None
-    related_account_bank_id: BankId | None
+class TransactionFields(Protocol):
+    @property
+    def remote_info(self) -> str | None: ...
+    @property
+    def additional_transaction_info(self) -> str | None: ...
+    @property
+    def related_account_id(self) -> Optional["AccountId"]: ...
+    @property
+    def related_account_bank_id(self) -> Optional["BankId"]: ...
 
+
+class TransactionMixin:
+    """Properties shared by `Transaction` and `LazyTransaction`"""
     @property
-    def info(self) -> str:
+    def info(self: TransactionFields) -> str:
         remote_info = (self.remote_info or "").strip()
         additional_transaction_info = (self.additional_transaction_info or "").strip()
 
@@ -207,14 +339,123 @@ class Transaction(BaseModel):
             return remote_info or additional_transaction_info
 
     @property
-    def related_account(self) -> str | None:
+    def related_account(self: TransactionFields) -> str | None:
         if self.related_account_id is None and self.related_account_bank_id is None:
             return None
         else:
             return f"{self.related_account_id}/{self.related_account_bank_id}"
 
 
-class BankToCustomerStatement(BaseModel):
+class Transaction(TransactionMixin, BaseModel):
+    ref: TransactionRef
+    entry_ref: str
+    amount: Decimal
+    currency: str
+    val_date: datetime.date
+    remote_info: str | None
+    additional_transaction_info: str | None
+    related_account_id: AccountId | None
+    related_account_bank_id: BankId | None
+
+
+class cached_attribute(Generic[T]):
+    """
+    Like `functools.cached_property`, without its per-instance lock (Python < 3.12)
+
+    The value is stored in instance `__dict__` on first access, which then takes precedence
+    over this (non-data) descriptor, so later accesses are plain attribute lookups.
+    """
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: Any, owner: type | None = None) -> T:
+        if instance is None:
+            return self  # type: ignore[return-value]
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
+
+class LazyTransaction(TransactionMixin):
+    """
+    Transaction which is decoded from its `Ntry` element only as far as it is used
+
+    It has the same attributes and properties as `Transaction`; each of them is decoded
+    on first access and cached. Elements of `Ntry` itself (amount, value date, entry reference)
+    are found in one pass over its direct children, transaction details (references, remittance
+    information, related party) only when one of them is accessed. Errors in the XML are raised
+    on access, not when the object is created.
+
+    The `Ntry` element, and so the whole XML tree, is kept in memory; use `to_transaction()`
+    to get a regular `Transaction`.
+    """
+    def __init__(self, ntry: _Element) -> None:
+        self.ntry = ntry
+
+    def __repr__(self) -> str:
+        return f"<LazyTransaction at line {self.ntry.sourceline}>"
+
+    def to_transaction(self) -> Transaction:
+        return parse_transaction(self.ntry)
+
+    @cached_attribute
+    def _found(self) -> dict[str, _Element]:
+        return collect_elements(self.ntry, qualify_table("Ntry.own", get_namespace(self.ntry)))
+
+    @cached_attribute
+    def _details(self) -> dict[str, _Element]:
+        return collect_elements(self.ntry, qualify_table("Ntry.details", get_namespace(self.ntry)))
+
+    @cached_attribute
+    def _amount(self) -> tuple[Decimal, str]:
+        return amount_values(self._found)
+
+    @cached_attribute
+    def ref(self) -> TransactionRef:
+        return TransactionRef.from_xml(self._details.get("refs"))
+
+    @cached_attribute
+    def entry_ref(self) -> str:
+        return get_text(self._found.get("entry_ref"))
+
+    @cached_attribute
+    def amount(self) -> Decimal:
+        return self._amount[0]
+
+    @cached_attribute
+    def currency(self) -> str:
+        return self._amount[1]
+
+    @cached_attribute
+    def val_date(self) -> datetime.date:
+        return parse_date_isoformat(get_text(self._found.get("val_date")))
+
+    @cached_attribute
+    def remote_info(self) -> str | None:
+        return get_text_or_none(self._details.get("remote_info"))
+
+    @cached_attribute
+    def additional_transaction_info(self) -> str | None:
+        return get_text_or_none(self._details.get("additional_transaction_info"))
+
+    @cached_attribute
+    def related_account_id(self) -> AccountId | None:
+        account, _ = related_party_elements(self._details)
+        return AccountId.from_xml(account) if account is not None else None
+
+    @cached_attribute
+    def related_account_bank_id(self) -> BankId | None:
+        _, agent = related_party_elements(self._details)
+        return BankId.from_xml(agent) if agent is not None else None
+
+
+class StatementHeader(BaseModel):
+    """
+    Statement metadata and balances, ie. everything in `Stmt` except for the entries
+
+    See `read_statement_header()` for reading it without parsing the transactions.
+    """
     statement_id: str
     created_time: datetime.datetime
     from_time: datetime.datetime
@@ -222,33 +463,256 @@ class BankToCustomerStatement(BaseModel):
     account_id: AccountId
     opening_balance: Balance | None
     closing_balance: Balance | None
+
+
+class BankToCustomerStatement(StatementHeader):
     transactions: list[Transaction]
 
     @classmethod
-    def from_file(cls, path: str) -> "BankToCustomerStatement":
-        with open(path, "rb") as fp:
-            raw_xml = fp.read()
+    def from_file(cls, path: StrPath, validate: bool = True,
+                  validate_schema: bool = False) -> "BankToCustomerStatement":
+        """
+        Parse statement from camt.053 file
+
+        Args:
+            path: path to input file, possibly compressed, see `open_input()`
+            validate: if False, the statement and its header are created without Pydantic validation
+                (transactions are validated either way), see `parse_statement()`
+            validate_schema: if True, the file is validated against XSD schema of its camt.053 version,
+                see `load_schema()`; `lxml.etree.DocumentInvalid` is raised for invalid files
+        """
+        path = os.fspath(path)
+        tree = parse_tree(path)
+        if validate_schema:
+            validate_tree(tree, path)
+        return cls._from_root(tree.getroot(), validate, path)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, validate: bool = True) -> "BankToCustomerStatement":
+        """
+        Parse statement from content of camt.053 file
 
-        raw_xml_no_namespace = raw_xml.replace(b'xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02"', b"")
-        tree = etree.parse(BytesIO(raw_xml_no_namespace))
-        root = tree.getroot()
+        Args:
+            data: content of camt.053 file
+            validate: see `from_file()`
+        """
+        return cls.from_buffer(data, validate=validate)
 
-        return parse_statement(root)
+    @classmethod
+    def from_buffer(cls, buffer: BufferLike, validate: bool = True,
+                    validate_schema: bool = False) -> "BankToCustomerStatement":
+        """
+        Parse statement from any object supporting the buffer protocol, without copying it
+
+        This can be `bytes`, `bytearray`, `memoryview` or `mmap.mmap`, so that large files
+        can be memory-mapped instead of read.
+
+        Args:
+            buffer: content of camt.053 file
+            validate, validate_schema: see `from_file()`
+        """
+        with _phase("parse") as phase:
+            root = parse_buffer(buffer)
+            if phase is not None:
+                phase.bytes_read = memoryview(buffer).nbytes
+        if validate_schema:
+            validate_tree(root.getroottree())
+        return cls._from_root(root, validate)
 
-    def as_dataframe(self) -> "pd.DataFrame":
-        if pd is None:
-            raise RuntimeError("pandas is not installed")
+    @classmethod
+    def from_fileobj(cls, fp: BinaryIO, validate: bool = True,
+                     validate_schema: bool = False) -> "BankToCustomerStatement":
+        """
+        Parse statement from binary file object, eg. `sys.stdin.buffer`
+
+        The file is read in chunks by the XML parser, not all at once.
+
+        Args:
+            fp: file object opened for reading in binary mode
+            validate, validate_schema: see `from_file()`
+        """
+        with _phase("parse") as phase:
+            tree = etree.parse(fp)
+            if phase is not None:
+                try:
+                    phase.bytes_read = fp.tell()
+                except (OSError, ValueError):
+                    pass  # eg. pipe
+        if validate_schema:
+            validate_tree(tree)
+        return cls._from_root(tree.getroot(), validate)
 
-        rows = [flatten_dict(tx.model_dump(), prefix="transaction.") for tx in self.transactions]
-        df = pd.DataFrame.from_records(rows)
-        df["statement.id"] = self.statement_id
-        df["statement.account_id"] = str(self.account_id)
+    @classmethod
+    def _from_root(cls, root: _Element, validate: bool, path: str | None = None) -> "BankToCustomerStatement":
+        with _phase("transactions", path) as phase:
+            statement = parse_statement(root, validate=validate)
+            if phase is not None:
+                phase.entries = len(statement.transactions)
+        return statement
+
+    def as_dataframe(self) -> "pd.DataFrame":
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError("pandas is not installed") from None
+
+        with _phase("as_dataframe") as phase:
+            rows = [flatten_dict(tx.model_dump(), prefix="transaction.") for tx in self.transactions]
+            df = pd.DataFrame.from_records(rows, columns=TRANSACTION_COLUMNS)
+            df["statement.id"] = self.statement_id
+            df["statement.account_id"] = str(self.account_id)
+            if phase is not None:
+                phase.entries = len(df)
         return df
 
 
-def parse_statement(root: _Element) -> BankToCustomerStatement:
+class StatementCollection:
+    """
+    Statements with indexes of their transactions, for lookups across many statements
+
+    Transactions are indexed by `entry_ref`, `ref.end_to_end_id`, `ref.account_servicer_ref`
+    and IBAN/id of the related account in hash tables, and by `val_date` in a sorted list.
+    Indexes are updated as statements are added, so point queries take O(1) and date range
+    queries O(log n) plus the size of the result. (After adding statements, the first range query
+    merges the new transactions into the sorted list, which is linear when statements are added
+    roughly in chronological order.)
+    """
+    def __init__(self, statements: Iterable[BankToCustomerStatement] = ()) -> None:
+        self.statements: list[BankToCustomerStatement] = []
+        self._statement_of: dict[int, BankToCustomerStatement] = {}
+        self._by_entry_ref: dict[str, list[Transaction]] = {}
+        self._by_end_to_end_id: dict[str, list[Transaction]] = {}
+        self._by_account_servicer_ref: dict[str, list[Transaction]] = {}
+        self._by_account: dict[str, list[Transaction]] = {}
+        self._by_val_date: list[Transaction] = []
+        self._by_val_date_sorted = True
+        for statement in statements:
+            self.add(statement)
+
+    @classmethod
+    def from_files(cls, paths: Iterable[str], jobs: int | None = 1) -> "StatementCollection":
+        """Parse camt.053 files into a collection, see `parse_many()`"""
+        collection = cls()
+        for result in parse_many(paths, jobs=jobs):
+            if result.error is not None:
+                raise result.error
+            assert result.value is not None
+            collection.add(result.value)
+        return collection
+
+    def add(self, statement: BankToCustomerStatement) -> None:
+        self.statements.append(statement)
+        for tx in statement.transactions:
+            self._statement_of[id(tx)] = statement
+            self._by_entry_ref.setdefault(tx.entry_ref, []).append(tx)
+            if (end_to_end_id := tx.ref.end_to_end_id) is not None:
+                self._by_end_to_end_id.setdefault(end_to_end_id, []).append(tx)
+            if (account_servicer_ref := tx.ref.account_servicer_ref) is not None:
+                self._by_account_servicer_ref.setdefault(account_servicer_ref, []).append(tx)
+            if (account := tx.related_account_id) is not None:
+                if account.iban is not None:
+                    self._by_account.setdefault(account.iban, []).append(tx)
+                if account.id is not None and account.id != account.iban:
+                    self._by_account.setdefault(account.id, []).append(tx)
+        self._by_val_date.extend(statement.transactions)
+        self._by_val_date_sorted = False
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def __iter__(self) -> Iterator[BankToCustomerStatement]:
+        return iter(self.statements)
+
+    @property
+    def num_transactions(self) -> int:
+        return len(self._by_val_date)
+
+    def statement_of(self, transaction: Transaction) -> BankToCustomerStatement:
+        """Return statement containing given transaction (object from this collection)"""
+        return self._statement_of[id(transaction)]
+
+    def find_by_entry_ref(self, entry_ref: str) -> list[Transaction]:
+        return list(self._by_entry_ref.get(entry_ref, ()))
+
+    def find_by_end_to_end_id(self, end_to_end_id: str) -> list[Transaction]:
+        return list(self._by_end_to_end_id.get(end_to_end_id, ()))
+
+    def find_by_account_servicer_ref(self, account_servicer_ref: str) -> list[Transaction]:
+        return list(self._by_account_servicer_ref.get(account_servicer_ref, ()))
+
+    def find_by_account(self, account: str) -> list[Transaction]:
+        """Return transactions whose related account has given IBAN or other id"""
+        return list(self._by_account.get(account, ()))
+
+    def find_by_val_date(self, start: datetime.date | None = None,
+                         end: datetime.date | None = None) -> list[Transaction]:
+        """Return transactions with `start <= val_date <= end`, ordered by `val_date`"""
+        if not self._by_val_date_sorted:
+            # stable sort, so transactions with the same date stay in the order they were added
+            self._by_val_date.sort(key=lambda tx: tx.val_date)
+            self._by_val_date_sorted = True
+        lo = 0 if start is None else bisect.bisect_left(self._by_val_date, start, key=lambda tx: tx.val_date)
+        hi = (len(self._by_val_date) if end is None
+              else bisect.bisect_right(self._by_val_date, end, key=lambda tx: tx.val_date))
+        return self._by_val_date[lo:hi]
+
+
+def model_columns(model: type[BaseModel], prefix: str = "") -> list[str]:
+    """
+    Return column names for flattened model, as produced by `flatten_dict(model.model_dump())`
+
+    Nested models are always expanded into their fields, even if they are optional.
+    """
+    columns = []
+    for name, field in model.model_fields.items():
+        for tp in (field.annotation, *get_args(field.annotation)):
+            if isinstance(tp, type) and issubclass(tp, BaseModel):
+                columns.extend(model_columns(tp, prefix=f"{prefix}{name}."))
+                break
+        else:
+            columns.append(f"{prefix}{name}")
+    return columns
+
+
+#: Columns of `BankToCustomerStatement.as_dataframe()` and CSV/XLSX output
+TRANSACTION_COLUMNS = model_columns(Transaction, prefix="transaction.")
+STATEMENT_COLUMNS = ["statement.id", "statement.account_id"]
+
+
+def parse_statement(root: _Element, validate: bool = True) -> BankToCustomerStatement:
+    """
+    Parse statement from `Document` element
+
+    Any camt.053 version (`camt.053.001.02`, `.04`, `.08`, ...) is accepted; element paths
+    are resolved in the namespace of the `Document` element, or without namespace if it has none.
+
+    The parser already produces values of correct types, so validation of the statement and its header
+    can be skipped with `validate=False` ("trusted" mode). The resulting objects are the same
+    either way. Transactions are validated in both modes, since one pydantic-core call per transaction
+    is faster than `model_construct()` of its nested models, see `benchmarks/bench_validate.py`.
+    """
     stmt = get_element(root, "BkToCstmrStmt/Stmt")
-    statement_id = get_text(stmt.find("Id"))
+    header = parse_statement_header(stmt, validate=validate)
+    transactions = parse_transactions(stmt)
+
+    return construct(
+        BankToCustomerStatement,
+        validate,
+        **dict(header),
+        transactions=transactions
+    )
+
+
+def construct(model: type[M], validate: bool, **fields: Any) -> M:
+    """Create model instance, skipping validation if `validate` is False"""
+    if validate:
+        return model(**fields)
+    else:
+        return model.model_construct(**fields)
+
+
+def parse_statement_header(stmt: _Element, validate: bool = True) -> StatementHeader:
+    statement_id = get_text(stmt, "Id")
     created_time = datetime.datetime.fromisoformat(get_text(stmt, "CreDtTm"))
     from_time = datetime.datetime.fromisoformat(get_text(stmt, "FrToDt/FrDtTm"))
     to_time = datetime.datetime.fromisoformat(get_text(stmt, "FrToDt/ToDtTm"))
@@ -259,7 +723,7 @@ def parse_statement(root: _Element) -> BankToCustomerStatement:
     if account_id is None:
         raise ValueError("Missing AccountID elements")
 
-    for bal in stmt.findall("Bal"):
+    for bal in findall(stmt, "Bal"):
         bal_date = parse_date_isoformat(get_text(bal, "Dt/Dt"))
         amt = get_element(bal, "Amt")
         bal_currency = get_attribute(amt, "Ccy")
@@ -269,7 +733,9 @@ def parse_statement(root: _Element) -> BankToCustomerStatement:
             amount *= -1
         tmp2 = get_text(bal, "Tp/CdOrPrtry/Cd")
 
-        balance = Balance(
+        balance = construct(
+            Balance,
+            validate,
             amount=amount,
             currency=bal_currency,
             date=bal_date
@@ -280,9 +746,9 @@ def parse_statement(root: _Element) -> BankToCustomerStatement:
         elif tmp2 == "CLBD":
             closing_balance = balance
 
-    transactions = parse_transactions(stmt)
-
-    return BankToCustomerStatement(
+    return construct(
+        StatementHeader,
+        validate,
         statement_id=statement_id,
         created_time=created_time,
         from_time=from_time,
@@ -290,55 +756,1642 @@ def parse_statement(root: _Element) -> BankToCustomerStatement:
         account_id=account_id,
         opening_balance=opening_balance,
         closing_balance=closing_balance,
-        transactions=transactions
     )
 
 
+#: Elements to find in one pass, see `collect_elements()`
+ELEMENT_TABLES: dict[str, ElementTable] = {
+    "Ntry": {
+        "NtryRef": "entry_ref",
+        "Amt": "amount",
+        "CdtDbtInd": "credit_or_debit",
+        "ValDt": {"Dt": "val_date"},
+        "NtryDtls": {
+            "TxDtls": {
+                "Refs": "refs",
+                "RmtInf": {"Ustrd": "remote_info"},
+                "AddtlTxInf": "additional_transaction_info",
+                "RltdPties": {
+                    "DbtrAcct": {"Id": "debtor_account_id"},
+                    "CdtrAcct": {"Id": "creditor_account_id"},
+                },
+                "RltdAgts": {
+                    "DbtrAgt": {"FinInstnId": "debtor_agent_id"},
+                    "CdtrAgt": {"FinInstnId": "creditor_agent_id"},
+                },
+            },
+        },
+    },
+    "Refs": {tag: name for name, tag in TransactionRef.XML_TAGS.items()},
+    "AccountId": {"IBAN": "iban", "Othr": {"Id": "id"}},
+    "FinInstnId": {"BIC": "bic", "BICFI": "bicfi", "Othr": {"Id": "id"}},
+}
+# `LazyTransaction` collects elements of `Ntry` itself and of its transaction details separately
+ELEMENT_TABLES["Ntry.own"] = {tag: target for tag, target in ELEMENT_TABLES["Ntry"].items() if tag != "NtryDtls"}
+ELEMENT_TABLES["Ntry.details"] = {tag: target for tag, target in ELEMENT_TABLES["Ntry"].items() if tag == "NtryDtls"}
+# `summarize_statement()` only needs amounts
+ELEMENT_TABLES["Ntry.amount"] = {tag: target for tag, target in ELEMENT_TABLES["Ntry"].items()
+                                 if tag in ("Amt", "CdtDbtInd")}
+
+
 def parse_transactions(stmt: _Element) -> list[Transaction]:
-    return [parse_transaction(ntry) for ntry in stmt.findall("Ntry")]
+    return [parse_transaction(ntry) for ntry in findall(stmt, "Ntry")]
+
+
+def parse_transactions_lazy(stmt: _Element) -> list[LazyTransaction]:
+    """Return transactions of `Stmt` element which are decoded on first access, see `LazyTransaction`"""
+    return [LazyTransaction(ntry) for ntry in findall(stmt, "Ntry")]
+
+
+def read_transactions_lazy(path: StrPath) -> list[LazyTransaction]:
+    """
+    Read transactions from camt.053 file, to be decoded on first access, see `LazyTransaction`
+
+    This is much faster than `BankToCustomerStatement.from_file()` when only a few fields
+    of each transaction are used.
+    """
+    root = parse_tree(path).getroot()
+    return parse_transactions_lazy(get_element(root, "BkToCstmrStmt/Stmt"))
 
 
 def parse_transaction(ntry: _Element) -> Transaction:
-    entry_ref = get_text(ntry, "NtryRef")
-    ref = TransactionRef.from_xml(ntry.find("NtryDtls/TxDtls/Refs"))
+    return transaction_from_row(parse_transaction_row(ntry))
+
 
-    amt = get_element(ntry, "Amt")
+def parse_transaction_row(ntry: _Element) -> tuple[Any, ...]:
+    """
+    Parse `Ntry` element into plain values, in the order of `TRANSACTION_COLUMNS`
+
+    This gives the same values as flattened `parse_transaction(ntry).model_dump()`,
+    without creating any models. The subtree is walked only once, see `collect_elements()`.
+    """
+    found = collect_elements(ntry, qualify_table("Ntry", get_namespace(ntry)))
+
+    entry_ref = get_text(found.get("entry_ref"))
+    if (refs := found.get("refs")) is not None:
+        ref = transaction_ref_values(refs)
+    else:
+        ref = (None,) * len(TransactionRef.XML_TAGS)
+
+    amount, currency = amount_values(found)
+
+    val_date = parse_date_isoformat(get_text(found.get("val_date")))
+
+    remote_info = get_text_or_none(found.get("remote_info"))
+    additional_transaction_info = get_text_or_none(found.get("additional_transaction_info"))
+
+    account, agent = related_party_elements(found)
+    related_account_id = account_id_values(account) if account is not None else (None, None)
+    related_account_bank_id = bank_id_values(agent) if agent is not None else (None, None)
+
+    return (
+        *ref,
+        entry_ref,
+        amount,
+        currency,
+        val_date,
+        remote_info,
+        additional_transaction_info,
+        *related_account_id,
+        *related_account_bank_id,
+    )
+
+
+def amount_values(found: dict[str, _Element]) -> tuple[Decimal, str]:
+    """Return signed amount and currency from elements collected from `Ntry`"""
+    if (amt := found.get("amount")) is None:
+        raise ValueError("Missing mandatory element (Amt)")
     currency = get_attribute(amt, "Ccy")
     amount = Decimal(get_text(amt))
-    tmp = CreditOrDebit(get_text(ntry, "CdtDbtInd"))
+    tmp = CreditOrDebit(get_text(found.get("credit_or_debit")))
     if tmp == CreditOrDebit.DBIT:
         amount *= -1
+    return amount, currency
+
 
-    val_date = parse_date_isoformat(get_text(ntry, "ValDt/Dt"))
+def related_party_elements(found: dict[str, _Element]) -> tuple[_Element | None, _Element | None]:
+    """
+    Return account `Id` and `FinInstnId` elements of the related party from elements collected from `Ntry`
 
-    remote_info = get_text_or_none(ntry, "NtryDtls/TxDtls/RmtInf/Ustrd")
-    additional_transaction_info = get_text_or_none(ntry, "NtryDtls/TxDtls/AddtlTxInf")
+    The related party is the debtor, or the creditor if there is no debtor.
+    """
+    account = found.get("debtor_account_id")
+    if account is None:
+        account = found.get("creditor_account_id")
+    agent = found.get("debtor_agent_id")
+    if agent is None:
+        agent = found.get("creditor_agent_id")
+    return account, agent
+
+
+def transaction_from_row(row: tuple[Any, ...]) -> Transaction:
+    """
+    Inverse of `parse_transaction_row()`
+
+    The transaction is always validated: validating nested models from dicts in one pydantic-core call
+    is faster than creating them one by one with `model_construct()`.
+    """
+    n = len(TransactionRef.XML_TAGS)
+    ref = dict(zip(TransactionRef.XML_TAGS, row[:n]))
+    (entry_ref, amount, currency, val_date, remote_info, additional_transaction_info,
+     iban, account_id, bic, bank_id) = row[n:]
+    related_account_id = {"iban": iban, "id": account_id} if iban or account_id else None
+    related_account_bank_id = {"bic": bic, "id": bank_id} if bic or bank_id else None
+
+    return Transaction.model_validate({
+        "ref": ref,
+        "entry_ref": entry_ref,
+        "amount": amount,
+        "currency": currency,
+        "val_date": val_date,
+        "remote_info": remote_info,
+        "additional_transaction_info": additional_transaction_info,
+        "related_account_id": related_account_id,
+        "related_account_bank_id": related_account_bank_id,
+    })
+
+
+COMPRESSED_OPENERS: dict[str, Callable[[str, str], Any]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+ZIP_MEMBER_SEPARATOR = "::"
+
+
+def split_zip_member(path: StrPath) -> tuple[str, str | None]:
+    """
+    Split `"bundle.zip::member.xml"` into path of the archive and name of the member
+
+    The path is only split if the part before `::` ends with `.zip` and is an existing file,
+    any other path (eg. `"stmt::2023.xml"`) is a plain file and member is None.
+    """
+    path = os.fspath(path)
+    start = 0
+    while (i := path.find(ZIP_MEMBER_SEPARATOR, start)) != -1:
+        archive = path[:i]
+        if archive.lower().endswith(".zip") and os.path.isfile(archive):
+            return archive, path[i + len(ZIP_MEMBER_SEPARATOR):]
+        start = i + 1
+    return path, None
+
+
+def is_plain_path(path: StrPath) -> bool:
+    """Return True if `path` is an uncompressed file, see `open_input()`"""
+    path = os.fspath(path)
+    archive, member = split_zip_member(path)
+    return member is None and os.path.splitext(path)[1].lower() not in COMPRESSED_OPENERS
+
+
+def open_input(path: StrPath) -> BinaryIO:
+    """
+    Open input file for reading, decompressing it on the fly
+
+    Files ending with `.gz`, `.bz2` or `.xz` are decompressed, a member of zip archive is given
+    as `"bundle.zip::member.xml"` (see `expand_input()`). All functions which take path
+    to a camt.053 file read it with this function.
+    """
+    path = os.fspath(path)
+    archive, member = split_zip_member(path)
+    if member is not None:
+        import zipfile
+        with zipfile.ZipFile(archive) as zf:
+            # the member stays readable after the archive is closed
+            return cast(BinaryIO, zf.open(member))
+
+    opener = COMPRESSED_OPENERS.get(os.path.splitext(path)[1].lower())
+    if opener is not None:
+        return cast(BinaryIO, opener(path, "rb"))
+    return open(path, "rb")
+
+
+def input_stat(path: StrPath) -> os.stat_result:
+    """Return `os.stat()` of input file, or of the archive for zip members"""
+    return os.stat(split_zip_member(path)[0])
+
+
+def expand_input(path: StrPath) -> list[str]:
+    """
+    Return paths of statements contained in input file
+
+    For a zip archive, this is every `.xml` member as `"bundle.zip::member.xml"`,
+    any other path is returned as is (without checking that it exists).
+    """
+    path = os.fspath(path)
+    if os.path.splitext(path)[1].lower() != ".zip":
+        return [path]
+    import zipfile
+    with zipfile.ZipFile(path) as zf:
+        return [f"{path}{ZIP_MEMBER_SEPARATOR}{info.filename}" for info in zf.infolist()
+                if not info.is_dir() and info.filename.lower().endswith(".xml")]
+
+
+def open_statements(path: StrPath) -> Iterator[tuple[str, BinaryIO]]:
+    """
+    Yield `(path, fp)` for each statement in input file, see `expand_input()` and `open_input()`
+
+    Each file object is closed when the iteration continues.
+    """
+    for statement_path in expand_input(path):
+        with open_input(statement_path) as fp:
+            yield statement_path, fp
+
+
+def parse_tree(path: StrPath) -> etree._ElementTree:
+    """Parse XML tree of input file, see `open_input()`"""
+    path = os.fspath(path)
+    with _phase("parse", path) as phase:
+        if is_plain_path(path):
+            tree = etree.parse(path)
+            if phase is not None:
+                phase.bytes_read = os.path.getsize(path)
+        else:
+            with open_input(path) as fp:
+                tree = etree.parse(fp)
+                if phase is not None:
+                    phase.bytes_read = fp.tell()
+    return tree
+
+
+class BufferReader:
+    """Read-only file object over a buffer, returns chunks without copying the rest of the buffer"""
+
+    def __init__(self, buffer: BufferLike) -> None:
+        self.view = memoryview(buffer).cast("B")
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self.view) if size is None or size < 0 else self.position + size
+        chunk = self.view[self.position:end].tobytes()
+        self.position += len(chunk)
+        return chunk
+
+
+def parse_buffer(buffer: BufferLike) -> _Element:
+    """Parse XML from object supporting the buffer protocol, see `BankToCustomerStatement.from_buffer()`"""
+    if isinstance(buffer, bytes):
+        return etree.fromstring(buffer)
+    try:
+        # lxml >= 5 parses buffers directly
+        return etree.fromstring(buffer)  # type: ignore[call-overload]
+    except (TypeError, ValueError):
+        return etree.parse(cast(BinaryIO, BufferReader(buffer))).getroot()
+
+
+SCHEMA_DIR_ENV = "OKANE_SCHEMA_DIR"
+CAMT053_NAMESPACE_PATTERN = re.compile(r"urn:iso:std:iso:20022:tech:xsd:(camt\.053\.[0-9]{3}\.[0-9]{2})")
+BUNDLED_SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "okane_schemas")
+
+
+def schema_path(namespace: str | None) -> str:
+    """
+    Return path to XSD schema for given camt.053 namespace
+
+    Schemas are named by the last part of the namespace, eg. `camt.053.001.02.xsd`
+    for `urn:iso:std:iso:20022:tech:xsd:camt.053.001.02`. The ISO 20022 schemas of all camt.053
+    versions are installed with okane (`BUNDLED_SCHEMA_DIR`), other schemas (eg. bank-specific
+    variants) can be used by setting `OKANE_SCHEMA_DIR` environment variable to their directory.
+    Namespaces other than `urn:iso:std:iso:20022:tech:xsd:camt.053.NNN.NN` raise ValueError.
+    """
+    if namespace is None:
+        raise ValueError("Cannot validate document without namespace, camt.053 version is unknown")
+    # the namespace comes from the input document, it must not choose an arbitrary file
+    if (m := CAMT053_NAMESPACE_PATTERN.fullmatch(namespace)) is None:
+        raise ValueError(f"Cannot validate document with namespace {namespace!r}, it is not a camt.053 namespace")
+    directory = os.environ.get(SCHEMA_DIR_ENV) or BUNDLED_SCHEMA_DIR
+    path = os.path.join(directory, m.group(1) + ".xsd")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No XSD schema for namespace {namespace}, expected {path}")
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _load_schema(path: str) -> etree.XMLSchema:
+    return etree.XMLSchema(etree.parse(path))
+
+
+def load_schema(namespace: str | None) -> etree.XMLSchema:
+    """
+    Return compiled XSD schema for given camt.053 namespace, see `schema_path()`
+
+    Each schema is compiled once per process (ie. once per worker of `parse_many()`).
+    """
+    return _load_schema(schema_path(namespace))
+
+
+def validate_tree(tree: etree._ElementTree, path: str | None = None) -> None:
+    """Validate parsed camt.053 document against its XSD schema, raise `lxml.etree.DocumentInvalid` if invalid"""
+    with _phase("validate_schema", path):
+        load_schema(get_namespace(tree.getroot())).assertValid(tree)
+
+
+def read_namespace(fp: BinaryIO) -> str | None:
+    """Return namespace of the root element, reading only the start of the file"""
+    for _, e in etree.iterparse(fp, events=("start",)):
+        return get_namespace(e)
+    return None
+
+
+def iter_transactions(path: StrPath) -> Iterator[Transaction]:
+    """
+    Parse transactions from camt.053 file one by one, in constant memory
+
+    This gives the same transactions as `BankToCustomerStatement.from_file()` (ie. those of the first
+    `Stmt` element), but it never holds the whole XML tree or list of transactions in memory:
+    each `Ntry` element is parsed as soon as it is read and discarded right after, so this
+    is suitable for very large statements. Use `read_statement_header()` to get the rest of the statement.
+    """
+    with open_input(path) as fp:
+        for ntry in iterparse_entries(fp):
+            yield parse_transaction(ntry)
+
+
+def iterparse_entries(fp: BinaryIO, schema: etree.XMLSchema | None = None) -> Iterator[_Element]:
+    """
+    Yield `Ntry` elements of the first statement (`Stmt`) in camt.053 file one by one
+
+    Like `BankToCustomerStatement.from_file()`, only the first `Stmt` of the document is read,
+    reading stops at its end. Each element (and everything before it) is freed after the caller
+    is done with it, so it must not be used after advancing the iterator. If `schema` is given,
+    the whole document is validated as it is read, and `lxml.etree.XMLSyntaxError` is raised
+    at the first error.
+    """
+    events = etree.iterparse(fp, tag=("{*}Stmt", "{*}Ntry"), schema=schema)
+    for _, e in events:
+        if etree.QName(e).localname == "Stmt":
+            break
+        yield e
+
+        # free the entry and everything parsed before it
+        e.clear(keep_tail=True)
+        parent = e.getparent()
+        while e.getprevious() is not None:
+            del parent[0]
+
+    if schema is not None:
+        # entries of the other statements are not used, but they must be read to be validated
+        for _, e in events:
+            e.clear(keep_tail=True)
+
+
+def read_statement_header(path: StrPath) -> StatementHeader:
+    """
+    Parse statement metadata and balances from camt.053 file, skipping the transactions
+
+    Reading stops at the first `Ntry` element, so this is cheap even for very large statements.
+    """
+    stmt = None
+    with open_input(path) as fp:
+        for event, e in etree.iterparse(fp, events=("start", "end"), tag=("{*}Stmt", "{*}Ntry")):
+            if event == "start" and stmt is None and etree.QName(e).localname == "Stmt":
+                stmt = e
+            elif event == "start" or (event == "end" and e is stmt):
+                break
 
-    if (dbtr_acct_id := ntry.find("NtryDtls/TxDtls/RltdPties/DbtrAcct/Id")) is not None:
-        related_account_id = AccountId.from_xml(dbtr_acct_id)
-    elif (cdtr_acct_id := ntry.find("NtryDtls/TxDtls/RltdPties/CdtrAcct/Id")) is not None:
-        related_account_id = AccountId.from_xml(cdtr_acct_id)
+    if stmt is None:
+        raise ValueError("Missing mandatory element (BkToCstmrStmt/Stmt)")
+
+    return parse_statement_header(stmt)
+
+
+def parse_to_columns(path: StrPath, minor_units: bool = False, validate_schema: bool = False) -> dict[str, list[Any]]:
+    """
+    Parse camt.053 file directly into columns of `as_dataframe()`
+
+    This gives the same data as `BankToCustomerStatement.from_file(path).as_dataframe()`,
+    but much faster, since no `Transaction` models are created. The file is read
+    in a streaming fashion, like in `iter_transactions()`; as with `from_file()`, only the first
+    `Stmt` element is read, so every row belongs to the statement of `read_statement_header()`.
+
+    Args:
+        path: path to input file
+        minor_units: if True, `transaction.amount` is given as integer in minor units
+            of the currency (eg. cents), see `to_minor_units()`
+        validate_schema: if True, the file is validated against XSD schema while it is read,
+            see `iterparse_entries()`
+
+    Returns:
+        Dictionary mapping `TRANSACTION_COLUMNS` and `STATEMENT_COLUMNS` to lists of values
+    """
+    path = os.fspath(path)
+    with _phase("parse_to_columns", path) as phase:
+        header = read_statement_header(path)
+        columns: dict[str, list[Any]] = {name: [] for name in TRANSACTION_COLUMNS}
+        column_lists = list(columns.values())
+
+        schema = None
+        if validate_schema:
+            with open_input(path) as fp:
+                schema = load_schema(read_namespace(fp))
+
+        with open_input(path) as fp:
+            for ntry in iterparse_entries(fp, schema=schema):
+                for column, value in zip(column_lists, parse_transaction_row(ntry)):
+                    column.append(value)
+            if phase is not None:
+                phase.bytes_read = fp.tell()
+                phase.entries = len(column_lists[0])
+
+    if minor_units:
+        columns["transaction.amount"] = [to_minor_units(amount, currency) for amount, currency
+                                         in zip(columns["transaction.amount"], columns["transaction.currency"])]
+
+    n = len(column_lists[0])
+    columns["statement.id"] = [header.statement_id] * n
+    columns["statement.account_id"] = [str(header.account_id)] * n
+    return columns
+
+
+def read_dataframe(paths: StrPath | Iterable[StrPath], minor_units: bool = False,
+                   jobs: int | None = 1) -> "pd.DataFrame":
+    """
+    Read one or more camt.053 files into one DataFrame, see `parse_to_columns()`
+
+    Args:
+        paths: path or paths to input files
+        minor_units: if True, `transaction.amount` is int64 in minor units of the currency
+        jobs: number of worker processes, see `parse_many()`
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        raise RuntimeError("pandas is not installed") from None
+
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    columns: dict[str, list[Any]] = {name: [] for name in TRANSACTION_COLUMNS + STATEMENT_COLUMNS}
+    for result in map_files(functools.partial(parse_to_columns, minor_units=minor_units),
+                            (os.fspath(path) for path in paths), jobs=jobs):
+        if result.error is not None:
+            raise result.error
+        assert result.value is not None
+        for name, values in result.value.items():
+            columns[name].extend(values)
+
+    df = pd.DataFrame(columns)
+    if minor_units:
+        df["transaction.amount"] = df["transaction.amount"].astype("int64")
+    return df
+
+
+#: Number of decimal places of ISO 4217 currencies, if different from 2
+CURRENCY_EXPONENTS = {
+    **dict.fromkeys(["BIF", "CLP", "DJF", "GNF", "ISK", "JPY", "KMF", "KRW", "PYG", "RWF",
+                     "UGX", "UYI", "VND", "VUV", "XAF", "XOF", "XPF"], 0),
+    **dict.fromkeys(["BHD", "IQD", "JOD", "KWD", "LYD", "OMR", "TND"], 3),
+    **dict.fromkeys(["CLF", "UYW"], 4),
+}
+
+
+def to_minor_units(amount: Decimal, currency: str) -> int:
+    """
+    Convert amount to integer in minor units of the currency, eg. `Decimal("12.34"), "CZK"` to `1234`
+
+    Raises:
+        ValueError: if the amount has more decimal places than the currency allows
+    """
+    exponent = CURRENCY_EXPONENTS.get(currency, 2)
+    value = amount.scaleb(exponent)
+    if value != value.to_integral_value():
+        raise ValueError(f"Amount {amount} has too many decimal places for currency {currency}")
+    return int(value)
+
+
+def from_minor_units(value: int, currency: str) -> Decimal:
+    """Inverse of `to_minor_units()`"""
+    return Decimal(value).scaleb(-CURRENCY_EXPONENTS.get(currency, 2))
+
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+class TransactionTable:
+    """
+    Compact column-oriented container of transactions, an alternative to `list[Transaction]`
+
+    Values are stored in flat arrays instead of one Pydantic model per transaction:
+
+    - amounts as int64 in minor units of the currency (see `to_minor_units()`),
+    - value dates as int32 days since 1970-01-01 (like Arrow `date32`),
+    - `DICTIONARY_COLUMNS` as int32 codes into a list of distinct values (-1 for None),
+    - other text columns as UTF-8 in one shared buffer, with int64 offset and int32 length
+      of each value (length -1 for None).
+
+    Indexing gives a `Transaction` created on demand, slicing gives a `TransactionTable`
+    sharing the dictionaries and the string buffer. `to_numpy()` and `to_pandas()` wrap
+    the numeric arrays without copying them.
+
+    Raises:
+        ValueError: when appending an amount with more decimal places than its currency allows
+    """
+    DICTIONARY_COLUMNS = [
+        "transaction.currency",
+        "transaction.related_account_id.iban",
+        "transaction.related_account_id.id",
+        "transaction.related_account_bank_id.bic",
+        "transaction.related_account_bank_id.id",
+    ]
+    TEXT_COLUMNS = [name for name in TRANSACTION_COLUMNS if name.startswith("transaction.ref.")] + [
+        "transaction.entry_ref",
+        "transaction.remote_info",
+        "transaction.additional_transaction_info",
+    ]
+
+    def __init__(self) -> None:
+        self.amounts = array("q")
+        self.val_dates = array("i")
+        self.codes = {name: array("i") for name in self.DICTIONARY_COLUMNS}
+        self.dictionaries: dict[str, list[str]] = {name: [] for name in self.DICTIONARY_COLUMNS}
+        self.buffer = bytearray()
+        self.offsets = {name: array("q") for name in self.TEXT_COLUMNS}
+        self.lengths = {name: array("i") for name in self.TEXT_COLUMNS}
+        self._dictionary_index: dict[str, dict[str, int]] = {name: {} for name in self.DICTIONARY_COLUMNS}
+
+    @classmethod
+    def from_file(cls, path: StrPath) -> "TransactionTable":
+        """Parse transactions from camt.053 file, in a streaming fashion like `iter_transactions()`"""
+        table = cls()
+        with open_input(path) as fp:
+            for ntry in iterparse_entries(fp):
+                table.append_row(parse_transaction_row(ntry))
+        return table
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> "TransactionTable":
+        table = cls()
+        for tx in transactions:
+            values = flatten_dict(tx.model_dump(), prefix="transaction.")
+            table.append_row(tuple(values.get(name) for name in TRANSACTION_COLUMNS))
+        return table
+
+    def append_row(self, row: tuple[Any, ...]) -> None:
+        """Append transaction given as values in order of `TRANSACTION_COLUMNS`, see `parse_transaction_row()`"""
+        values = dict(zip(TRANSACTION_COLUMNS, row))
+        self.amounts.append(to_minor_units(values["transaction.amount"], values["transaction.currency"]))
+        self.val_dates.append(values["transaction.val_date"].toordinal() - EPOCH_ORDINAL)
+
+        for name in self.DICTIONARY_COLUMNS:
+            value = values[name]
+            if value is None:
+                code = -1
+            elif (code := self._dictionary_index[name].get(value, -1)) == -1:
+                code = self._dictionary_index[name][value] = len(self.dictionaries[name])
+                self.dictionaries[name].append(value)
+            self.codes[name].append(code)
+
+        for name in self.TEXT_COLUMNS:
+            value = values[name]
+            self.offsets[name].append(len(self.buffer))
+            if value is None:
+                self.lengths[name].append(-1)
+            else:
+                data = value.encode("utf-8")
+                self.buffer += data
+                self.lengths[name].append(len(data))
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @overload
+    def __getitem__(self, key: int) -> Transaction: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "TransactionTable": ...
+
+    def __getitem__(self, key: int | slice) -> "Transaction | TransactionTable":
+        if isinstance(key, slice):
+            table = TransactionTable.__new__(TransactionTable)
+            table.amounts = self.amounts[key]
+            table.val_dates = self.val_dates[key]
+            table.codes = {name: codes[key] for name, codes in self.codes.items()}
+            table.dictionaries = self.dictionaries
+            table.buffer = self.buffer
+            table.offsets = {name: offsets[key] for name, offsets in self.offsets.items()}
+            table.lengths = {name: lengths[key] for name, lengths in self.lengths.items()}
+            table._dictionary_index = self._dictionary_index
+            return table
+        return transaction_from_row(self.row(key))
+
+    def row(self, i: int) -> tuple[Any, ...]:
+        """Return values of i-th transaction in order of `TRANSACTION_COLUMNS`, see `parse_transaction_row()`"""
+        values: dict[str, Any] = {}
+        for name in self.DICTIONARY_COLUMNS:
+            code = self.codes[name][i]
+            values[name] = self.dictionaries[name][code] if code != -1 else None
+        for name in self.TEXT_COLUMNS:
+            offset, length = self.offsets[name][i], self.lengths[name][i]
+            values[name] = self.buffer[offset:offset + length].decode("utf-8") if length != -1 else None
+        values["transaction.amount"] = from_minor_units(self.amounts[i], values["transaction.currency"])
+        values["transaction.val_date"] = datetime.date.fromordinal(self.val_dates[i] + EPOCH_ORDINAL)
+        return tuple(values[name] for name in TRANSACTION_COLUMNS)
+
+    def to_numpy(self) -> dict[str, "np.ndarray"]:
+        """
+        Return columns as NumPy arrays
+
+        `transaction.amount` (int64, minor units), `transaction.val_date` (int32, days since epoch)
+        and dictionary codes (int32, suffix `.code`) are views of the underlying arrays,
+        so the table cannot grow while they exist. Other columns are object arrays of strings.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise RuntimeError("numpy is not installed") from None
+
+        columns: dict[str, np.ndarray] = {}
+        for name in TRANSACTION_COLUMNS:
+            if name == "transaction.amount":
+                columns[name] = np.frombuffer(self.amounts, dtype=np.int64)
+            elif name == "transaction.val_date":
+                columns[name] = np.frombuffer(self.val_dates, dtype=np.int32)
+            elif name in self.codes:
+                columns[name + ".code"] = np.frombuffer(self.codes[name], dtype=np.int32)
+            else:
+                columns[name] = np.array([self.buffer[offset:offset + length].decode("utf-8")
+                                          if length != -1 else None
+                                          for offset, length in zip(self.offsets[name], self.lengths[name])],
+                                         dtype=object)
+        return columns
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """
+        Return transactions as DataFrame with `TRANSACTION_COLUMNS`
+
+        `transaction.amount` is int64 in minor units of the currency (not copied),
+        dictionary columns are categoricals made from the codes, `transaction.val_date` is datetime64.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError("pandas is not installed") from None
+
+        arrays = self.to_numpy()
+        columns: dict[str, Any] = {}
+        for name in TRANSACTION_COLUMNS:
+            if name == "transaction.val_date":
+                columns[name] = arrays[name].astype("datetime64[D]")
+            elif name in self.codes:
+                columns[name] = pd.Categorical.from_codes(arrays[name + ".code"],
+                                                          categories=pd.Index(self.dictionaries[name], dtype=object))
+            else:
+                columns[name] = arrays[name]
+        return pd.DataFrame(columns, copy=False)
+
+
+class FingerprintSet:
+    """
+    Set of 64-bit integers (eg. hashes), stored compactly in one `array("Q")`
+
+    Open addressing with linear probing, kept at most half full, so it takes 16-32 bytes
+    per element instead of ~70-100 bytes of a Python `set` of `int` objects.
+    """
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Args:
+            capacity: initial number of slots, rounded up to power of two
+        """
+        bits = max(capacity - 1, 1).bit_length()
+        self._table = array("Q", bytes(8 << bits))
+        self._shift = 64 - bits
+        self._len = 0
+        self._has_zero = False  # zero marks an empty slot, so it is tracked separately
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, value: int) -> bool:
+        if value == 0:
+            return self._has_zero
+        table = self._table
+        mask = len(table) - 1
+        i = self._slot(value)
+        while (v := table[i]) != 0:
+            if v == value:
+                return True
+            i = (i + 1) & mask
+        return False
+
+    def add(self, value: int) -> bool:
+        """Add value to the set, return False if it was already there"""
+        if value == 0:
+            if self._has_zero:
+                return False
+            self._has_zero = True
+            self._len += 1
+            return True
+
+        table = self._table
+        mask = len(table) - 1
+        i = self._slot(value)
+        while (v := table[i]) != 0:
+            if v == value:
+                return False
+            i = (i + 1) & mask
+        table[i] = value
+        self._len += 1
+        if 2 * self._len > len(table):
+            self._grow()
+        return True
+
+    def _slot(self, value: int) -> int:
+        # Fibonacci hashing, so that values which differ only in high bits are spread too
+        return ((value * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+
+    def _grow(self) -> None:
+        old_table = self._table
+        self._table = array("Q", bytes(16 * len(old_table)))
+        self._shift -= 1
+        self._len = int(self._has_zero)
+        for value in old_table:
+            if value != 0:
+                self.add(value)
+
+
+#: Columns which identify a transaction for `Deduplicator`, together with the statement account
+DEDUPE_COLUMNS = [name for name in TRANSACTION_COLUMNS if name.startswith("transaction.ref.")] + [
+    "transaction.entry_ref",
+    "transaction.amount",
+    "transaction.currency",
+    "transaction.val_date",
+]
+
+
+def transaction_fingerprint(account_id: str, values: Iterable[Any]) -> int:
+    """
+    Return 64-bit hash of transaction values in order of `DEDUPE_COLUMNS`
+
+    Amounts are normalized, so that eg. `100.0` and `100.00` give the same fingerprint.
+    """
+    parts = [account_id]
+    for value in values:
+        if value is None:
+            parts.append("\0")
+        elif isinstance(value, Decimal):
+            parts.append(str(value.normalize()))
+        else:
+            parts.append(str(value))
+    digest = hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class Deduplicator:
+    """
+    Removes transactions which were already seen in previous statements, eg. when statements overlap
+
+    A transaction is a duplicate if it has the same account, `entry_ref`, `TransactionRef` fields,
+    amount, currency and `val_date` as an earlier one (see `DEDUPE_COLUMNS`). Only 64-bit
+    fingerprints of the seen transactions are kept (see `FingerprintSet`), so this can stream over
+    tens of millions of transactions; the chance of a false positive is about n²/2⁶⁵.
+    """
+    def __init__(self) -> None:
+        self.seen = FingerprintSet()
+        self.num_duplicates = 0
+
+    def filter_statement(self, statement: BankToCustomerStatement) -> BankToCustomerStatement:
+        """Return copy of the statement without duplicate transactions (balances are not changed)"""
+        account_id = str(statement.account_id)
+        transactions = []
+        for tx in statement.transactions:
+            values = (*(getattr(tx.ref, name) for name in TransactionRef.XML_TAGS),
+                      tx.entry_ref, tx.amount, tx.currency, tx.val_date)
+            if self.seen.add(transaction_fingerprint(account_id, values)):
+                transactions.append(tx)
+            else:
+                self.num_duplicates += 1
+        if len(transactions) == len(statement.transactions):
+            return statement
+        return statement.model_copy(update={"transactions": transactions})
+
+    def filter_columns(self, columns: dict[str, list[Any]]) -> dict[str, list[Any]]:
+        """Return columns from `parse_to_columns()` without rows of duplicate transactions"""
+        keep = [self.seen.add(transaction_fingerprint(account_id, values))
+                for account_id, *values in zip(columns["statement.account_id"],
+                                               *(columns[name] for name in DEDUPE_COLUMNS))]
+        self.num_duplicates += keep.count(False)
+        if all(keep):
+            return columns
+        return {name: [value for value, k in zip(values, keep) if k] for name, values in columns.items()}
+
+
+def dedupe(statements: Iterable[BankToCustomerStatement]) -> Iterator[BankToCustomerStatement]:
+    """Yield statements without transactions which appeared in previous statements, see `Deduplicator`"""
+    deduplicator = Deduplicator()
+    for statement in statements:
+        yield deduplicator.filter_statement(statement)
+
+
+@dataclass
+class StatementSummary:
+    """
+    Balances and total of transactions of a statement in integer minor units, see `verify_statements()`
+
+    Attributes:
+        opening_balance: opening balance in minor units of `currency`, or None if missing
+        closing_balance: closing balance in minor units of `currency`, or None if missing
+        total: sum of transaction amounts in minor units
+    """
+    statement_id: str
+    account_id: str
+    from_time: datetime.datetime
+    to_time: datetime.datetime
+    currency: str | None
+    opening_balance: int | None
+    closing_balance: int | None
+    total: int
+    num_transactions: int
+    path: str | None = None
+
+    @classmethod
+    def from_statement(cls, statement: BankToCustomerStatement, path: str | None = None) -> "StatementSummary":
+        return cls.from_header(statement, [to_minor_units(tx.amount, tx.currency) for tx in statement.transactions],
+                               path=path)
+
+    @classmethod
+    def from_header(cls, header: StatementHeader, amounts: Iterable[int], path: str | None = None,
+                    ) -> "StatementSummary":
+        """Create summary from statement header and amounts of transactions in minor units"""
+        amounts = array("q", amounts)
+        balance = header.opening_balance or header.closing_balance
+        return cls(
+            statement_id=header.statement_id,
+            account_id=str(header.account_id),
+            from_time=header.from_time,
+            to_time=header.to_time,
+            currency=balance.currency if balance is not None else None,
+            opening_balance=(to_minor_units(header.opening_balance.amount, header.opening_balance.currency)
+                             if header.opening_balance is not None else None),
+            closing_balance=(to_minor_units(header.closing_balance.amount, header.closing_balance.currency)
+                             if header.closing_balance is not None else None),
+            total=sum(amounts),
+            num_transactions=len(amounts),
+            path=path,
+        )
+
+
+def summarize_statement(path: StrPath) -> StatementSummary:
+    """
+    Read balances and sum of transactions from camt.053 file
+
+    Only the header and amounts of entries are parsed. The entries are read in a streaming fashion
+    (see `iterparse_entries()`), so memory use does not depend on the size of the statement.
+    """
+    path = os.fspath(path)
+    header = read_statement_header(path)
+
+    amounts = array("q")
+    table: ElementTable | None = None
+    with open_input(path) as fp:
+        for ntry in iterparse_entries(fp):
+            if table is None:
+                table = qualify_table("Ntry.amount", get_namespace(ntry))
+            amounts.append(to_minor_units(*amount_values(collect_elements(ntry, table))))
+    return StatementSummary.from_header(header, amounts, path=path)
+
+
+class IssueKind(str, Enum):
+    BALANCE_MISMATCH = "balance-mismatch"
+    DISCONTINUITY = "discontinuity"
+    GAP = "gap"
+    OVERLAP = "overlap"
+    DUPLICATE = "duplicate"
+
+
+@dataclass
+class VerificationIssue:
+    """
+    Problem found by `verify_statements()`
+
+    Attributes:
+        kind: type of the problem
+        account_id: account of the statement(s)
+        statement_ids: one statement, or two consecutive statements of the account
+        message: human readable description
+        difference: for balance problems, the difference in minor units
+    """
+    kind: IssueKind
+    account_id: str
+    statement_ids: tuple[str, ...]
+    message: str
+    difference: int | None = None
+
+    def __str__(self) -> str:
+        return f"{self.kind.value}: {self.account_id}: {self.message}"
+
+
+def verify_statements(statements: Iterable[StatementSummary | BankToCustomerStatement]) -> list[VerificationIssue]:
+    """
+    Check balances of statements, in exact integer arithmetic
+
+    Each statement must satisfy `opening balance + sum of transactions == closing balance`.
+    Statements of each account are ordered by their period, and each one must start
+    where the previous one ended:
+
+    - `discontinuity`: opening balance differs from closing balance of the previous statement
+    - `gap`: there is at least one whole day between the previous statement and this one
+    - `overlap`: the statement starts before the previous one ends
+    - `duplicate`: the account has more statements with the same `statement_id`
+
+    Returns:
+        Found issues, ordered by account and period
+    """
+    by_account: dict[str, list[StatementSummary]] = {}
+    for statement in statements:
+        if isinstance(statement, BankToCustomerStatement):
+            statement = StatementSummary.from_statement(statement)
+        by_account.setdefault(statement.account_id, []).append(statement)
+
+    issues = []
+    for account_id, summaries in sorted(by_account.items()):
+        summaries.sort(key=lambda summary: (summary.from_time, summary.to_time))
+        seen_ids = set()
+        previous = None
+        for summary in summaries:
+            if summary.statement_id in seen_ids:
+                issues.append(VerificationIssue(IssueKind.DUPLICATE, account_id, (summary.statement_id,),
+                                                f"statement {summary.statement_id} appears more than once"))
+                continue
+            seen_ids.add(summary.statement_id)
+
+            if summary.opening_balance is not None and summary.closing_balance is not None:
+                difference = summary.closing_balance - summary.opening_balance - summary.total
+                if difference != 0:
+                    issues.append(VerificationIssue(
+                        IssueKind.BALANCE_MISMATCH, account_id, (summary.statement_id,),
+                        f"statement {summary.statement_id}: opening balance {summary.opening_balance} + "
+                        f"transactions {summary.total} != closing balance {summary.closing_balance} "
+                        f"(in minor units of {summary.currency})",
+                        difference))
+
+            if previous is not None:
+                ids = (previous.statement_id, summary.statement_id)
+                if summary.from_time < previous.to_time:
+                    issues.append(VerificationIssue(
+                        IssueKind.OVERLAP, account_id, ids,
+                        f"statement {ids[1]} starts at {summary.from_time.isoformat()}, "
+                        f"before statement {ids[0]} ends at {previous.to_time.isoformat()}"))
+                elif summary.from_time.date() > previous.to_time.date() + datetime.timedelta(days=1):
+                    issues.append(VerificationIssue(
+                        IssueKind.GAP, account_id, ids,
+                        f"no statement from {previous.to_time.date()} to {summary.from_time.date()} "
+                        f"between statements {ids[0]} and {ids[1]}"))
+                if previous.closing_balance is not None and summary.opening_balance is not None:
+                    difference = summary.opening_balance - previous.closing_balance
+                    if difference != 0:
+                        issues.append(VerificationIssue(
+                            IssueKind.DISCONTINUITY, account_id, ids,
+                            f"statement {ids[1]} opens with {summary.opening_balance}, but statement {ids[0]} "
+                            f"closes with {previous.closing_balance} (in minor units of {summary.currency})",
+                            difference))
+            previous = summary
+
+    return issues
+
+
+@dataclass
+class PhaseStats:
+    """
+    Measurements of one phase of processing one file, see `ParseStats`
+
+    Attributes:
+        phase: name of the phase, eg. "parse" (lxml tree building, including reading the file),
+            "transactions" (creating models), "parse_to_columns", "as_dataframe", "dedupe", "write"
+        path: path to the input file, if known
+        wall_time: elapsed time in seconds
+        cpu_time: CPU time of the process in seconds
+        bytes_read: size of the input read in this phase
+        entries: number of `Ntry` elements/transactions processed
+        peak_memory: peak memory allocated during the phase in bytes (above the amount allocated
+            at its start), or None if memory is not traced
+    """
+    phase: str
+    path: str | None = None
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    bytes_read: int = 0
+    entries: int = 0
+    peak_memory: int | None = None
+
+
+class ParseStats:
+    """
+    Collects `PhaseStats` of parsing and export, for finding out where the time went
+
+    Nothing is measured unless the collector is activated, so instrumentation is nearly free
+    otherwise. Files parsed in worker processes of `map_files()` are measured too, their records
+    are sent back with the results.
+
+    Use as `with stats.activate(): ...`, `okane` CLI tool has `--stats` option.
+    """
+
+    def __init__(self, callback: Callable[[PhaseStats], None] | None = None, trace_memory: bool = False) -> None:
+        """
+        Args:
+            callback: called with each finished `PhaseStats`
+            trace_memory: if True, peak memory of each phase is measured with `tracemalloc`,
+                which makes parsing several times slower
+        """
+        self.callback = callback
+        self.trace_memory = trace_memory
+        self.records: list[PhaseStats] = []
+        # peak memory of enclosing phases seen before `tracemalloc.reset_peak()` of nested phases
+        self._outer_peaks: list[int] = []
+
+    @contextmanager
+    def activate(self) -> Iterator["ParseStats"]:
+        """Measure phases in the current process while in the `with` block"""
+        global _active_stats
+        previous = _active_stats
+        start_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        _active_stats = self
+        try:
+            yield self
+        finally:
+            _active_stats = previous
+            if start_tracing:
+                tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name: str, path: str | None = None) -> Iterator[PhaseStats]:
+        """Measure the `with` block as one phase, its `entries`/`bytes_read` can be filled in by the caller"""
+        record = PhaseStats(name, path)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            start_memory, peak = tracemalloc.get_traced_memory()
+            if self._outer_peaks:
+                self._outer_peaks[-1] = max(self._outer_peaks[-1], peak)
+            self._outer_peaks.append(start_memory)
+            tracemalloc.reset_peak()
+        t0, c0 = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record.wall_time = time.perf_counter() - t0
+            record.cpu_time = time.process_time() - c0
+            if tracing:
+                peak = max(tracemalloc.get_traced_memory()[1], self._outer_peaks.pop())
+                record.peak_memory = peak - start_memory
+            self.add(record)
+
+    def add(self, record: PhaseStats) -> None:
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def totals(self) -> dict[str, dict[str, Any]]:
+        """Sums of all records by phase (nested phases are included in the enclosing ones as well)"""
+        totals: dict[str, dict[str, Any]] = {}
+        for r in self.records:
+            total = totals.setdefault(r.phase, {"count": 0, "wall_time": 0.0, "cpu_time": 0.0,
+                                                "bytes_read": 0, "entries": 0, "peak_memory": None})
+            total["count"] += 1
+            total["wall_time"] += r.wall_time
+            total["cpu_time"] += r.cpu_time
+            total["bytes_read"] += r.bytes_read
+            total["entries"] += r.entries
+            if r.peak_memory is not None:
+                total["peak_memory"] = max(total["peak_memory"] or 0, r.peak_memory)
+        return totals
+
+    def to_json(self) -> dict[str, Any]:
+        """Records and totals as JSON-serializable dict"""
+        return {
+            "records": [dataclasses.asdict(r) for r in self.records],
+            "totals": self.totals(),
+            "max_rss": max_rss(),
+        }
+
+
+_active_stats: ParseStats | None = None
+_no_phase: ContextManager[None] = nullcontext()
+
+
+def _phase(name: str, path: str | None = None) -> ContextManager[PhaseStats | None]:
+    """Measure phase with the active `ParseStats`, or do nothing"""
+    if _active_stats is None:
+        return _no_phase
+    return _active_stats.phase(name, path)
+
+
+def max_rss() -> int | None:
+    """Peak resident memory of the current process in bytes, or None if not available"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return value if sys.platform == "darwin" else value * 1024
+
+
+@dataclass
+class ParseResult(Generic[T]):
+    """
+    Outcome of processing one input file, see `parse_many()`
+
+    Attributes:
+        path: path to the input file
+        value: parsed value (eg. `BankToCustomerStatement`), or None if there was an error
+        error: exception raised while processing the file, or None on success
+        stats: `PhaseStats` measured in a worker process, if `ParseStats` was active
+    """
+    path: str
+    value: T | None = None
+    error: Exception | None = None
+    stats: list[PhaseStats] | None = None
+
+
+def parse_many(paths: Iterable[str], jobs: int | None = 1, ordered: bool = True,
+               cache: Optional["Cache"] = None) -> Iterator[ParseResult[BankToCustomerStatement]]:
+    """
+    Parse multiple camt.053 files, possibly in parallel
+
+    Errors do not stop the batch, they are reported in `ParseResult.error` of the respective file.
+
+    Args:
+        paths: paths to input files
+        jobs: number of worker processes; with 1, files are parsed in the current process,
+            None or 0 means use all CPUs
+        ordered: if True, results are yielded in the same order as `paths`, otherwise
+            they are yielded as soon as they are ready
+        cache: if given, statements are loaded from/stored to the cache
+    """
+    func = BankToCustomerStatement.from_file if cache is None else cache.parse
+    return map_files(func, paths, jobs=jobs, ordered=ordered)
+
+
+def map_files(func: Callable[[str], T], paths: Iterable[str], jobs: int | None = 1,
+              ordered: bool = True) -> Iterator[ParseResult[T]]:
+    """
+    Apply `func` to each of `paths`, possibly in a process pool, see `parse_many()`
+
+    At most a few files per worker are in flight at any time, so results are produced
+    in a streaming fashion and memory use does not depend on the number of files.
+    """
+    # checked here and not in the generator, so that invalid `jobs` fails right away
+    return _map_files(func, paths, _num_jobs(jobs), ordered)
+
+
+def _num_jobs(jobs: int | None) -> int:
+    if jobs is not None and jobs < 0:
+        raise ValueError(f"jobs must be a non-negative number (0 or None for number of CPUs), got {jobs}")
+    return jobs or os.cpu_count() or 1
+
+
+def _map_files(func: Callable[[str], T], paths: Iterable[str], jobs: int,
+               ordered: bool) -> Iterator[ParseResult[T]]:
+    if jobs == 1:
+        for path in paths:
+            yield _apply(func, path)
+        return
+
+    stats = _active_stats
+    collect_stats = stats is not None
+    trace_memory = stats is not None and stats.trace_memory
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(jobs) as executor:
+        paths_iter = iter(paths)
+        pending: dict[Future[ParseResult[T]], str] = {}
+        queue: deque[Future[ParseResult[T]]] = deque()
+
+        def submit() -> None:
+            path = next(paths_iter, None)
+            if path is not None:
+                future = executor.submit(_apply_in_worker, func, path, collect_stats, trace_memory)
+                pending[future] = path
+                if ordered:
+                    queue.append(future)
+
+        def get_result(future: Future[ParseResult[T]]) -> ParseResult[T]:
+            path = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                return ParseResult(path, error=e)
+            if stats is not None and result.stats:
+                for record in result.stats:
+                    stats.add(record)
+                result.stats = None
+            return result
+
+        try:
+            for _ in range(2 * jobs):
+                submit()
+
+            if ordered:
+                while queue:
+                    future = queue.popleft()
+                    result = get_result(future)
+                    submit()
+                    yield result
+            else:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = get_result(future)
+                        submit()
+                        yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _apply(func: Callable[[str], T], path: str) -> ParseResult[T]:
+    try:
+        return ParseResult(path, func(path))
+    except Exception as e:
+        return ParseResult(path, error=e)
+
+
+def _apply_in_worker(func: Callable[[str], T], path: str, collect_stats: bool = False,
+                     trace_memory: bool = False) -> ParseResult[T]:
+    if collect_stats:
+        stats = ParseStats(trace_memory=trace_memory)
+        with stats.activate():
+            result = _apply(func, path)
+        result.stats = stats.records
+    else:
+        result = _apply(func, path)
+    if result.error is not None:
+        result.error = _picklable_error(result.error)
+    return result
+
+
+def _picklable_error(error: Exception) -> Exception:
+    try:
+        pickle.dumps(error)
+    except Exception:
+        # eg. lxml.etree.XMLSyntaxError cannot be sent back to the parent process
+        return RuntimeError(f"{type(error).__name__}: {error}")
+    return error
+
+
+def _from_bytes_in_worker(data: bytes, validate: bool) -> BankToCustomerStatement:
+    try:
+        return BankToCustomerStatement.from_bytes(data, validate=validate)
+    except Exception as e:
+        raise _picklable_error(e) from None
+
+
+async def aparse_bytes(data: bytes, validate: bool = True, executor: Executor | None = None,
+                       limit: "asyncio.Semaphore | None" = None) -> BankToCustomerStatement:
+    """
+    Parse statement from content of camt.053 file without blocking the event loop
+
+    Args:
+        data: content of camt.053 file
+        validate: see `BankToCustomerStatement.from_file()`
+        executor: thread or process pool to parse in; default is the event loop's default executor
+        limit: if given, it is acquired for the duration of parsing, so that callers sharing
+            the semaphore wait until a slot is free instead of piling up work in the executor
+    """
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        func = functools.partial(_from_bytes_in_worker, data, validate)
     else:
-        related_account_id = None
+        func = functools.partial(BankToCustomerStatement.from_bytes, data, validate=validate)
+
+    if limit is None:
+        return await loop.run_in_executor(executor, func)
+    async with limit:
+        return await loop.run_in_executor(executor, func)
 
-    if (dbtr_agt_id := ntry.find("NtryDtls/TxDtls/RltdAgts/DbtrAgt/FinInstnId")) is not None:
-        related_account_bank_id = BankId.from_xml(dbtr_agt_id)
-    elif (cdtr_agt_id := ntry.find("NtryDtls/TxDtls/RltdAgts/CdtrAgt/FinInstnId")) is not None:
-        related_account_bank_id = BankId.from_xml(cdtr_agt_id)
+
+async def aparse_many(paths: Iterable[str] | AsyncIterable[str], jobs: int | None = None, ordered: bool = True,
+                      validate: bool = True, executor: Executor | None = None,
+                      ) -> AsyncIterator[ParseResult[BankToCustomerStatement]]:
+    """
+    Parse multiple camt.053 files without blocking the event loop, see `parse_many()`
+
+    Reading and parsing of files runs in `executor` (default: the event loop's default executor).
+    At most `jobs` files are in flight at any time and next files are submitted only as results
+    are consumed, so a slow consumer or a long list of paths does not exhaust memory.
+
+    Args:
+        paths: paths to input files
+        jobs: maximum number of files parsed at once, None or 0 means number of CPUs
+        ordered: if True, results are yielded in the same order as `paths`, otherwise
+            they are yielded as soon as they are ready
+        validate: see `BankToCustomerStatement.from_file()`
+        executor: thread or process pool to parse in
+    """
+    jobs = _num_jobs(jobs)
+
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+    loop = asyncio.get_running_loop()
+    func = functools.partial(BankToCustomerStatement.from_file, validate=validate)
+    worker = _apply_in_worker if isinstance(executor, ProcessPoolExecutor) else _apply
+
+    if isinstance(paths, AsyncIterable):
+        paths_aiter = aiter(paths)
     else:
-        related_account_bank_id = None
-
-    return Transaction(
-        entry_ref=entry_ref,
-        ref=ref,
-        amount=amount,
-        currency=currency,
-        val_date=val_date,
-        remote_info=remote_info,
-        additional_transaction_info=additional_transaction_info,
-        related_account_id=related_account_id,
-        related_account_bank_id=related_account_bank_id,
-    )
+        paths_aiter = _aiter_sync(paths)
+
+    pending: dict[asyncio.Future[ParseResult[BankToCustomerStatement]], str] = {}
+    queue: deque[asyncio.Future[ParseResult[BankToCustomerStatement]]] = deque()
+
+    async def submit() -> None:
+        path = await anext(paths_aiter, None)
+        if path is not None:
+            future = loop.run_in_executor(executor, worker, func, path)
+            pending[future] = path
+            if ordered:
+                queue.append(future)
+
+    async def get_result(future: asyncio.Future[ParseResult[BankToCustomerStatement]],
+                         ) -> ParseResult[BankToCustomerStatement]:
+        path = pending.pop(future)
+        try:
+            return await future
+        except Exception as e:
+            return ParseResult(path, error=e)
+
+    try:
+        for _ in range(jobs):
+            await submit()
+
+        if ordered:
+            while queue:
+                future = queue.popleft()
+                result = await get_result(future)
+                await submit()
+                yield result
+        else:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    result = await get_result(future)
+                    await submit()
+                    yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def _aiter_sync(items: Iterable[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
+FD = TypeVar("FD", bound="FileDatabase")
+
+
+class FileDatabase:
+    """
+    SQLite database which remembers SHA-256 of files by path, size and mtime, base of `Cache` and `IngestState`
+
+    The connection is opened on first use. Subclasses give path to the database in `database_path()`
+    and create their own tables in `create_tables()`.
+    """
+    def __init__(self) -> None:
+        self._connection: sqlite3.Connection | None = None
+
+    def database_path(self) -> str:
+        raise NotImplementedError
+
+    def create_tables(self, connection: sqlite3.Connection) -> None:
+        pass
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.database_path(), timeout=60)
+            with connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS files "
+                                   "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT)")
+                connection.execute("CREATE INDEX IF NOT EXISTS files_digest ON files (digest)")
+                self.create_tables(connection)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self: FD) -> FD:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # connection cannot be pickled, worker processes open their own
+        return {**self.__dict__, "_connection": None}
+
+    def known_file_digest(self, path: str) -> tuple[str, os.stat_result, str | None]:
+        """Return absolute path, stat and remembered SHA-256 of the file, or None if the file is new or changed"""
+        path = os.path.abspath(path)
+        st = input_stat(path)
+        row = self.connection.execute("SELECT digest FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+                                      (path, st.st_size, st.st_mtime_ns)).fetchone()
+        return path, st, None if row is None else str(row[0])
+
+    @staticmethod
+    def store_file_digest(connection: sqlite3.Connection, path: str, st: os.stat_result, digest: str) -> None:
+        """Remember SHA-256 of the file, within the caller's transaction"""
+        connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                           (path, st.st_size, st.st_mtime_ns, digest))
+
+    def file_digest(self, path: str) -> str:
+        """
+        Return SHA-256 of file content
+
+        The file is only read if its size or mtime changed since the last time.
+        """
+        path, st, digest = self.known_file_digest(path)
+        if digest is None:
+            digest = sha256_file(path)
+            with self.connection as connection:
+                self.store_file_digest(connection, path, st, digest)
+        return digest
+
+
+class Cache(FileDatabase):
+    """
+    On-disk cache of parsed statements, for repeated runs over the same files
+
+    Statements are stored as compressed JSON, keyed by hash of the file content and okane version.
+    Loading a statement from the cache is several times faster than parsing the XML.
+    Files which passed XSD validation are remembered too, so they are not validated again.
+    To avoid hashing files on each run, hashes are remembered by file path, size and mtime.
+    When size of the cache exceeds `max_size`, least recently used statements are evicted.
+
+    The cache is an SQLite database in the given directory, and it can be used from multiple
+    processes at once (see `parse_many()`).
+    """
+    FILENAME = "okane-cache.sqlite3"
+
+    def __init__(self, directory: str, max_size: int | None = 1024**3) -> None:
+        """
+        Args:
+            directory: cache directory, created if it does not exist
+            max_size: maximum total size of stored statements in bytes, or None for no limit
+        """
+        super().__init__()
+        self.directory = directory
+        self.max_size = max_size
+
+    def database_path(self) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, self.FILENAME)
+
+    def create_tables(self, connection: sqlite3.Connection) -> None:
+        connection.execute("CREATE TABLE IF NOT EXISTS statements "
+                           "(digest TEXT, version TEXT, data BLOB, size INTEGER, last_used REAL, "
+                           "PRIMARY KEY (digest, version))")
+        connection.execute("CREATE TABLE IF NOT EXISTS valid_files "
+                           "(digest TEXT, namespace TEXT, PRIMARY KEY (digest, namespace))")
+
+    def parse(self, path: str, validate_schema: bool = False) -> BankToCustomerStatement:
+        """
+        Return statement from the cache, or parse it and store it in the cache
+
+        With `validate_schema=True`, the file is validated against XSD schema unless it already
+        passed validation before, see `BankToCustomerStatement.from_file()`. Invalid files
+        are not remembered, they are validated (and rejected) on each call.
+        """
+        statement = self.get(path)
+        if statement is None:
+            statement = BankToCustomerStatement.from_file(path, validate_schema=validate_schema)
+            self.put(path, statement)
+            if validate_schema:
+                self.set_valid(path)
+        elif validate_schema and not self.is_valid(path):
+            validate_tree(parse_tree(path), path)
+            self.set_valid(path)
+        return statement
+
+    def _digest_and_namespace(self, path: str) -> tuple[str, str]:
+        with open_input(path) as fp:
+            namespace = read_namespace(fp)
+        # fail the same way as validation would if there is no schema for the file
+        schema_path(namespace)
+        return self.file_digest(path), cast(str, namespace)
+
+    def is_valid(self, path: str) -> bool:
+        """Return True if the file passed XSD validation before, reads only the start of the file"""
+        row = self.connection.execute("SELECT 1 FROM valid_files WHERE digest = ? AND namespace = ?",
+                                      self._digest_and_namespace(path)).fetchone()
+        return row is not None
+
+    def set_valid(self, path: str) -> None:
+        """Remember that the file passed XSD validation"""
+        with self.connection as connection:
+            connection.execute("INSERT OR IGNORE INTO valid_files VALUES (?, ?)", self._digest_and_namespace(path))
+
+    def get(self, path: str) -> BankToCustomerStatement | None:
+        """Return cached statement for given file, or None"""
+        digest = self.file_digest(path)
+        with self.connection as connection:
+            row = connection.execute("SELECT data FROM statements WHERE digest = ? AND version = ?",
+                                     (digest, __version__)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE statements SET last_used = ? WHERE digest = ? AND version = ?",
+                               (time.time(), digest, __version__))
+        return BankToCustomerStatement.model_validate_json(zlib.decompress(row[0]))
+
+    def put(self, path: str, statement: BankToCustomerStatement) -> None:
+        """Store statement parsed from given file"""
+        digest = self.file_digest(path)
+        data = zlib.compress(statement.model_dump_json().encode("utf-8"))
+        with self.connection as connection:
+            connection.execute("INSERT OR REPLACE INTO statements VALUES (?, ?, ?, ?, ?)",
+                               (digest, __version__, data, len(data), time.time()))
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used statements until the cache fits in `max_size`"""
+        if self.max_size is None:
+            return
+        with self.connection as connection:
+            total_size, = connection.execute("SELECT COALESCE(SUM(size), 0) FROM statements").fetchone()
+            if total_size <= self.max_size:
+                return
+            rows = connection.execute("SELECT digest, version, size FROM statements ORDER BY last_used").fetchall()
+            for digest, version, size in rows:
+                if total_size <= self.max_size:
+                    break
+                connection.execute("DELETE FROM statements WHERE digest = ? AND version = ?", (digest, version))
+                connection.execute("DELETE FROM valid_files WHERE digest = ?", (digest,))
+                total_size -= size
+
+
+class IngestState(FileDatabase):
+    """
+    Persistent record of files and statements already processed by `okane ingest`
+
+    Files are remembered by path, size, mtime and SHA-256 of their content, statements by account
+    and `statement_id` (statement IDs are often only sequence numbers per account).
+    Unchanged files are recognized without reading them, so checking an archive for new files
+    costs one `stat()` per file.
+
+    The state is an SQLite database at the given path.
+    """
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+
+    def database_path(self) -> str:
+        return self.path
+
+    def create_tables(self, connection: sqlite3.Connection) -> None:
+        connection.execute("CREATE TABLE IF NOT EXISTS statements "
+                           "(account_id TEXT, statement_id TEXT, path TEXT, digest TEXT, ingested_time REAL, "
+                           "PRIMARY KEY (account_id, statement_id))")
+
+    def new_file_digest(self, path: str) -> str | None:
+        """
+        Return SHA-256 of file content if the file was not processed yet, otherwise None
+
+        A file whose content was already processed under another path (eg. it was moved or copied)
+        is recorded under the new path and is not considered new.
+        """
+        path, st, known_digest = self.known_file_digest(path)
+        if known_digest is not None:
+            return None
+
+        digest = sha256_file(path)
+        row = self.connection.execute("SELECT 1 FROM files WHERE digest = ?", (digest,)).fetchone()
+        if row is not None:
+            with self.connection as connection:
+                self.store_file_digest(connection, path, st, digest)
+            return None
+        return digest
+
+    def has_statement(self, statement: StatementHeader) -> bool:
+        row = self.connection.execute("SELECT 1 FROM statements WHERE account_id = ? AND statement_id = ?",
+                                      (str(statement.account_id), statement.statement_id)).fetchone()
+        return row is not None
+
+    def add(self, path: str, digest: str, statement: StatementHeader | None = None) -> None:
+        """Record file (and the statement parsed from it) as processed"""
+        path = os.path.abspath(path)
+        st = input_stat(path)
+        with self.connection as connection:
+            self.store_file_digest(connection, path, st, digest)
+            if statement is not None:
+                connection.execute("INSERT OR IGNORE INTO statements VALUES (?, ?, ?, ?, ?)",
+                                   (str(statement.account_id), statement.statement_id, path, digest, time.time()))
+
+
+def sha256_file(path: StrPath) -> str:
+    h = hashlib.sha256()
+    with open_input(path) as fp:
+        while chunk := fp.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
 
 
 def parse_date_isoformat(s: str) -> datetime.date:
@@ -359,68 +2412,550 @@ def flatten_dict(d: dict[str, Any], prefix: str = "") -> dict[str, Any]:
     return output
 
 
+def columns_from_statement(statement: BankToCustomerStatement) -> dict[str, list[Any]]:
+    """Return the same columns as `parse_to_columns()`, for already parsed statement"""
+    rows = [flatten_dict(tx.model_dump(), prefix="transaction.") for tx in statement.transactions]
+    columns = {name: [row.get(name) for row in rows] for name in TRANSACTION_COLUMNS}
+    columns["statement.id"] = [statement.statement_id] * len(rows)
+    columns["statement.account_id"] = [str(statement.account_id)] * len(rows)
+    return columns
+
+
+@functools.lru_cache(maxsize=None)
+def arrow_schema() -> "pa.Schema":
+    """
+    Arrow schema for Parquet and Arrow IPC output, with the same columns as `as_dataframe()`
+
+    Amounts are `decimal128(18, 4)` (enough for any ISO 4217 currency), `val_date` is `date32`,
+    currencies and account/bank codes are dictionary-encoded strings.
+    """
+    try:
+        import pyarrow as pa  # type: ignore[import-untyped]
+    except ImportError:
+        raise RuntimeError("pyarrow is not installed") from None
+
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    types = {
+        "transaction.amount": pa.decimal128(18, 4),
+        "transaction.currency": dictionary,
+        "transaction.val_date": pa.date32(),
+        "transaction.related_account_id.iban": dictionary,
+        "transaction.related_account_id.id": dictionary,
+        "transaction.related_account_bank_id.bic": dictionary,
+        "transaction.related_account_bank_id.id": dictionary,
+        "statement.id": dictionary,
+        "statement.account_id": dictionary,
+    }
+    return pa.schema([
+        pa.field(name, types.get(name, pa.string()), nullable=name not in ("transaction.entry_ref",
+                                                                            "transaction.amount",
+                                                                            "transaction.currency",
+                                                                            "transaction.val_date",
+                                                                            *STATEMENT_COLUMNS))
+        for name in TRANSACTION_COLUMNS + STATEMENT_COLUMNS
+    ])
+
+
 class OutputFormat(str, Enum):
     JSON = "json"
+    NDJSON = "ndjson"
     CSV = "csv"
     XLSX = "xlsx"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+class XlsxSheets(str, Enum):
+    """How `XlsxWriter` distributes transactions into sheets"""
+    SINGLE = "single"
+    ACCOUNT = "account"
+    STATEMENT = "statement"
+
+
+class StatementWriter:
+    """
+    Base class for output writers used by the CLI
+
+    Statements are passed to `write()` one by one as they are parsed, and the writer
+    should output them as soon as possible instead of collecting all of them in memory.
+
+    Writers with `columnar = True` are given output of `parse_to_columns()` via `write_columns()`
+    instead, so that the CLI does not need to create any `Transaction` models.
+    """
+    columnar: bool = False
+    appendable: ClassVar[set[OutputFormat]] = {OutputFormat.JSON, OutputFormat.NDJSON, OutputFormat.CSV}
+
+    def __init__(self, fp: BinaryIO) -> None:
+        self.fp = fp
+
+    def write(self, statement: BankToCustomerStatement) -> None:
+        raise NotImplementedError
+
+    def write_columns(self, columns: dict[str, list[Any]]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    @staticmethod
+    def for_format(output_format: OutputFormat, fp: BinaryIO, indent: int | None = None,
+                   append: bool = False, sheets: XlsxSheets = XlsxSheets.SINGLE) -> "StatementWriter":
+        """
+        Create writer for given format
+
+        With `append=True`, output is appended to existing content of `fp` (only formats
+        in `StatementWriter.appendable`). `sheets` is only used for XLSX output.
+        """
+        if append and output_format not in StatementWriter.appendable:
+            raise ValueError(f"Cannot append to existing {output_format.value} output")
+        match output_format:
+            case OutputFormat.JSON:
+                return JsonWriter(fp, indent=indent)
+            case OutputFormat.NDJSON:
+                return NdjsonWriter(fp)
+            case OutputFormat.CSV:
+                return CsvWriter(fp, header=not append)
+            case OutputFormat.XLSX:
+                return XlsxWriter(fp, sheets=sheets)
+            case OutputFormat.PARQUET:
+                return ParquetWriter(fp)
+            case OutputFormat.ARROW:
+                return ArrowWriter(fp)
+            case _:
+                raise NotImplementedError(f"Unsupported output format {output_format}")
+
+
+class JsonWriter(StatementWriter):
+    """Writes each statement as JSON followed by newline"""
+    def __init__(self, fp: BinaryIO, indent: int | None = None) -> None:
+        super().__init__(fp)
+        self.indent = indent
+
+    def write(self, statement: BankToCustomerStatement) -> None:
+        self.fp.write(statement.model_dump_json(indent=self.indent).encode("utf-8"))
+        self.fp.write(b"\n")
+
+
+TRANSACTION_ADAPTER: TypeAdapter[Transaction] = TypeAdapter(Transaction)
+
+
+class NdjsonWriter(StatementWriter):
+    """
+    Writes one transaction per line, as `{"statement": {"id": ..., "account_id": ...}, "transaction": {...}}`
+
+    Transactions are serialized with `TRANSACTION_ADAPTER`, the statement part is serialized
+    only once per statement.
+    """
+    def write(self, statement: BankToCustomerStatement) -> None:
+        prefix = b'{"statement":' + json.dumps({"id": statement.statement_id,
+                                                "account_id": str(statement.account_id)},
+                                               separators=(",", ":")).encode("utf-8") + b',"transaction":'
+        dump_json = TRANSACTION_ADAPTER.dump_json
+        self.fp.writelines(b"%s%s}\n" % (prefix, dump_json(tx)) for tx in statement.transactions)
+
+
+class CsvWriter(StatementWriter):
+    """
+    Writes transactions of all statements into one CSV table, see `BankToCustomerStatement.as_dataframe()`
+
+    Rows are formatted with the `csv` module and written out after each statement, pandas is not needed.
+    """
+    columnar = True
+
+    def __init__(self, fp: BinaryIO, header: bool = True) -> None:
+        super().__init__(fp)
+        self.buffer = io.StringIO()
+        self.csv_writer = csv.writer(self.buffer, lineterminator="\n")
+        if header:
+            self.csv_writer.writerow(TRANSACTION_COLUMNS + STATEMENT_COLUMNS)
+            self.flush()
+
+    def write(self, statement: BankToCustomerStatement) -> None:
+        self.write_columns(columns_from_statement(statement))
+
+    def write_columns(self, columns: dict[str, list[Any]]) -> None:
+        self.csv_writer.writerows(zip(*(columns[name] for name in TRANSACTION_COLUMNS + STATEMENT_COLUMNS)))
+        self.flush()
+
+    def flush(self) -> None:
+        self.fp.write(self.buffer.getvalue().encode("utf-8"))
+        self.buffer.seek(0)
+        self.buffer.truncate()
+
+
+class XlsxWriter(StatementWriter):
+    """
+    Writes transactions into XLSX sheets, with the same columns as `BankToCustomerStatement.as_dataframe()`
+
+    Rows are streamed into an openpyxl write-only workbook, pandas is not needed. Amounts are
+    numeric cells and value dates are date cells. With `sheets` set to `XlsxSheets.ACCOUNT`
+    or `XlsxSheets.STATEMENT`, each account/statement gets its own sheet. A sheet which
+    reaches `max_rows` (the Excel limit, including header) is continued in a new sheet
+    with the same name and a " (2)", " (3)", ... suffix.
+    """
+    columnar = True
+    max_rows = 1_048_576
+    MAX_TITLE_LENGTH: ClassVar[int] = 31
+    INVALID_TITLE_CHARS: ClassVar[dict[int, int]] = str.maketrans("[]:*?/\\", "_______")
+
+    def __init__(self, fp: BinaryIO, sheets: XlsxSheets = XlsxSheets.SINGLE) -> None:
+        try:
+            import openpyxl  # type: ignore[import-untyped]
+        except ImportError:
+            raise RuntimeError("openpyxl is not installed") from None
+        super().__init__(fp)
+        self.sheets = sheets
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.titles: set[str] = set()
+        # sheet name -> (current worksheet, its number of rows)
+        self.worksheets: dict[str, tuple[Any, int]] = {}
+
+    def write(self, statement: BankToCustomerStatement) -> None:
+        self.write_columns(columns_from_statement(statement))
+
+    def write_columns(self, columns: dict[str, list[Any]]) -> None:
+        rows = zip(*(columns[name] for name in TRANSACTION_COLUMNS + STATEMENT_COLUMNS))
+        num_rows = len(columns["statement.id"])
+        match self.sheets:
+            case XlsxSheets.SINGLE:
+                name = "Sheet1"
+            case XlsxSheets.ACCOUNT:
+                if not num_rows:
+                    return
+                name = columns["statement.account_id"][0]
+            case XlsxSheets.STATEMENT:
+                if not num_rows:
+                    return
+                name = columns["statement.id"][0]
+
+        worksheet, sheet_rows = self.worksheets.get(name) or self.new_worksheet(name)
+        while num_rows > 0:
+            if sheet_rows == self.max_rows:
+                worksheet, sheet_rows = self.new_worksheet(name)
+            n = min(num_rows, self.max_rows - sheet_rows)
+            for row in itertools.islice(rows, n):
+                worksheet.append(row)
+            sheet_rows += n
+            num_rows -= n
+        self.worksheets[name] = (worksheet, sheet_rows)
+
+    def new_worksheet(self, name: str) -> tuple[Any, int]:
+        base = name.translate(self.INVALID_TITLE_CHARS) or "Sheet"
+        title = base[:self.MAX_TITLE_LENGTH]
+        i = 1
+        while title.lower() in self.titles:
+            i += 1
+            suffix = f" ({i})"
+            title = base[:self.MAX_TITLE_LENGTH - len(suffix)] + suffix
+        self.titles.add(title.lower())
+        worksheet = self.workbook.create_sheet(title)
+        worksheet.append(TRANSACTION_COLUMNS + STATEMENT_COLUMNS)
+        return worksheet, 1
+
+    def close(self) -> None:
+        if not self.worksheets:
+            self.new_worksheet("Sheet1")
+        self.workbook.save(self.fp)
+
+
+class ParquetWriter(StatementWriter):
+    """Writes transactions into Parquet file with `arrow_schema()`, one row group per statement"""
+    columnar = True
+
+    def __init__(self, fp: BinaryIO) -> None:
+        try:
+            import pyarrow.parquet as pq  # type: ignore[import-untyped]
+        except ImportError:
+            raise RuntimeError("pyarrow is not installed") from None
+        super().__init__(fp)
+        self.parquet_writer = pq.ParquetWriter(fp, arrow_schema())
+
+    def write(self, statement: BankToCustomerStatement) -> None:
+        self.write_columns(columns_from_statement(statement))
+
+    def write_columns(self, columns: dict[str, list[Any]]) -> None:
+        if columns["statement.id"]:
+            import pyarrow as pa  # type: ignore[import-untyped]
+            self.parquet_writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=arrow_schema()))
+
+    def close(self) -> None:
+        self.parquet_writer.close()
+
+
+class ArrowWriter(StatementWriter):
+    """
+    Writes transactions into Arrow IPC stream with `arrow_schema()`, one record batch per statement
+
+    The streaming format is used (read it with `pyarrow.ipc.open_stream()`), since unlike
+    the file format, it allows each batch to have its own dictionaries.
+    """
+    columnar = True
+
+    def __init__(self, fp: BinaryIO) -> None:
+        try:
+            import pyarrow as pa  # type: ignore[import-untyped]
+        except ImportError:
+            raise RuntimeError("pyarrow is not installed") from None
+        super().__init__(fp)
+        self.ipc_writer = pa.ipc.new_stream(fp, arrow_schema())
+
+    def write(self, statement: BankToCustomerStatement) -> None:
+        self.write_columns(columns_from_statement(statement))
+
+    def write_columns(self, columns: dict[str, list[Any]]) -> None:
+        if columns["statement.id"]:
+            import pyarrow as pa  # type: ignore[import-untyped]
+            self.ipc_writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=arrow_schema()))
+
+    def close(self) -> None:
+        self.ipc_writer.close()
+
+
+@contextmanager
+def open_output(path: str, append: bool = False) -> Iterator[BinaryIO]:
+    """Open output file for writing (or appending) in binary mode, `-` means stdout"""
+    if path == "-":
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+    else:
+        with open(path, "ab" if append else "wb") as fp:
+            yield fp
+
+
+#: Default `--pattern` of `okane ingest`, XML files and every input format of `open_input()`
+INGEST_PATTERNS = ["*.xml", *(f"*.xml{suffix}" for suffix in COMPRESSED_OPENERS), "*.zip"]
+
+
+def list_files(directory: str, pattern: str | Iterable[str]) -> list[str]:
+    """Return sorted paths of files in directory and its subdirectories matching the glob pattern(s)"""
+    patterns = [pattern] if isinstance(pattern, str) else list(pattern)
+    paths: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        paths.extend(os.path.join(dirpath, filename) for filename in filenames
+                     if any(fnmatch.fnmatch(filename, p) for p in patterns))
+    return sorted(paths)
+
+
+def expand_input_files(paths: Iterable[str]) -> tuple[list[str], int]:
+    """Expand zip archives given to the CLI with `expand_input()`, return paths and number of errors"""
+    import zipfile
+    expanded: list[str] = []
+    num_errors = 0
+    for path in paths:
+        try:
+            expanded.extend(expand_input(path))
+        except (OSError, zipfile.BadZipFile) as e:
+            print(f"okane: error: {path}: {e}", file=sys.stderr)
+            num_errors += 1
+    return expanded, num_errors
+
+
+STDIN_PATH = "-"
+
+
+def _non_negative_int(value: str) -> int:
+    import argparse
+    try:
+        n = int(value)
+    except ValueError:
+        n = -1
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got {value!r}")
+    return n
+
+
+def _parse_or_read_stdin(parse: Callable[[str], T], path: str,
+                         validate_schema: bool = False) -> T | BankToCustomerStatement:
+    if path == STDIN_PATH:
+        return BankToCustomerStatement.from_fileobj(sys.stdin.buffer, validate_schema=validate_schema)
+    return parse(path)
+
+
+def main_ingest(argv: list[str]) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(prog="okane ingest", description="Parse new or changed statements "
+                                     "in a directory and append them to the output; files and statements "
+                                     "processed in previous runs are remembered in the state file")
+    parser.add_argument("directory", help="directory with camt.053 XML files (optionally compressed "
+                        "or in zip archives), searched recursively")
+    parser.add_argument("--state", metavar="FILE", required=True, help="path to state file "
+                        "(SQLite database, created if it does not exist)")
+    parser.add_argument("--output", "-o", metavar="FILE", default="-", help="path to output file, "
+                        "new statements are appended to it (default: write to stdout)")
+    parser.add_argument("--format", "-f", choices=sorted(fmt.value for fmt in StatementWriter.appendable),
+                        type=OutputFormat, default=OutputFormat.JSON, help="set output format (default: json)")
+    parser.add_argument("--no-indent", action="store_true", help="do not indent JSON output files")
+    parser.add_argument("--pattern", action="append", help="glob pattern of input file names, can be repeated "
+                        f"(default: {', '.join(INGEST_PATTERNS)})")
+    parser.add_argument("--jobs", "-j", metavar="N", type=_non_negative_int, default=1, help="number of files to parse "
+                        "in parallel (default: 1, use 0 for number of CPUs)")
+
+    args = parser.parse_args(argv)
+    append = args.output != "-" and os.path.exists(args.output) and os.path.getsize(args.output) > 0
+
+    input_files, num_errors = expand_input_files(list_files(args.directory, args.pattern or INGEST_PATTERNS))
+    with IngestState(args.state) as state, open_output(args.output, append=True) as fp:
+        digests = {}
+        for path in input_files:
+            digest = state.new_file_digest(path)
+            if digest is not None:
+                digests[path] = digest
+
+        writer = StatementWriter.for_format(args.format, fp, indent=None if args.no_indent else 4, append=append)
+        for result in map_files(BankToCustomerStatement.from_file, digests, jobs=args.jobs):
+            statement = result.value
+            if statement is None:
+                print(f"okane: error: {result.path}: {result.error}", file=sys.stderr)
+                num_errors += 1
+                continue
+            if state.has_statement(statement):
+                print(f"okane: warning: {result.path}: statement {statement.statement_id} "
+                      "was already ingested, skipping", file=sys.stderr)
+            else:
+                writer.write(statement)
+                fp.flush()
+            state.add(result.path, digests[result.path], statement)
+        writer.close()
+
+    return 1 if num_errors else 0
+
+
+def main_verify(argv: list[str]) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(prog="okane verify", description="Check that opening balance plus "
+                                     "transactions equals closing balance of each statement, and that statements "
+                                     "of each account follow each other without gaps, overlaps or jumps in balance")
+    parser.add_argument("input_files", nargs="+", metavar="statement.xml",
+                        help="path to input camt.053 XML file(s) (optionally compressed "
+                        "or in .zip archives)")
+    parser.add_argument("--json", action="store_true", help="print issues as JSON lines")
+    parser.add_argument("--jobs", "-j", metavar="N", type=_non_negative_int, default=1, help="number of files to parse "
+                        "in parallel (default: 1, use 0 for number of CPUs)")
+
+    args = parser.parse_args(argv)
+
+    input_files, num_errors = expand_input_files(args.input_files)
+    summaries = []
+    paths: dict[tuple[str, str], list[str]] = {}
+    for result in map_files(summarize_statement, input_files, jobs=args.jobs):
+        if result.value is None:
+            print(f"okane: error: {result.path}: {result.error}", file=sys.stderr)
+            num_errors += 1
+            continue
+        summaries.append(result.value)
+        paths.setdefault((result.value.account_id, result.value.statement_id), []).append(result.path)
+
+    issues = verify_statements(summaries)
+    for issue in issues:
+        if args.json:
+            issue_paths = [path for statement_id in issue.statement_ids
+                           for path in paths[issue.account_id, statement_id]]
+            print(json.dumps({**dataclasses.asdict(issue), "kind": issue.kind.value, "paths": issue_paths}))
+        else:
+            print(issue)
+
+    return 1 if num_errors or issues else 0
 
 
 def main(argv: list[str]) -> int:
-    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    if argv and argv[0] == "ingest":
+        return main_ingest(argv[1:])
+    if argv and argv[0] == "verify":
+        return main_verify(argv[1:])
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog="Run `okane ingest --help` for incremental processing of a directory, "
+                                     "`okane verify --help` for checking balances of statements.")
     parser.add_argument("input_files", nargs="+", metavar="statement.xml",
-                        help="path to input camt.053 XML file(s)")
+                        help="path to input camt.053 XML file(s), or - for stdin; files ending with "
+                        ".gz, .bz2, .xz are decompressed, all .xml members of .zip archives are read")
     parser.add_argument("--version", "-V", action="version", version=__version__)
     parser.add_argument("--output", "-o", metavar="FILE", default="-", help="path to output file "
                         "(default: write to stdout)")
     parser.add_argument("--format", "-f", choices=[fmt.value for fmt in OutputFormat],
                         type=OutputFormat, default=OutputFormat.JSON, help="set output format (default: json)")
     parser.add_argument("--no-indent", action="store_true", help="do not indent JSON output files")
+    parser.add_argument("--sheets", choices=[sheets.value for sheets in XlsxSheets], type=XlsxSheets,
+                        default=XlsxSheets.SINGLE, help="put XLSX output into a single sheet, or one sheet "
+                        "per account or statement (default: single)")
+    parser.add_argument("--jobs", "-j", metavar="N", type=_non_negative_int, default=1, help="number of files to parse "
+                        "in parallel (default: 1, use 0 for number of CPUs)")
+    parser.add_argument("--cache-dir", metavar="DIR", help="cache parsed statements in given directory "
+                        "to speed up repeated runs over the same files")
+    parser.add_argument("--cache-max-size", metavar="MB", type=int, default=1024, help="maximum size "
+                        "of the cache (default: 1024 MB)")
+    parser.add_argument("--dedupe", action="store_true", help="skip transactions that already appeared "
+                        "in previous input files, eg. in overlapping statements")
+    parser.add_argument("--validate", action="store_true", help="reject input files which are not valid "
+                        f"according to camt.053 XSD schema (${SCHEMA_DIR_ENV} overrides the bundled schemas)")
+    parser.add_argument("--stats", metavar="FILE", help="write time spent in each phase of processing "
+                        "each file as JSON to given file (use - for stderr)")
+    parser.add_argument("--stats-memory", action="store_true", help="include peak allocated memory "
+                        "of each phase in --stats (slows down processing)")
 
     args = parser.parse_args(argv)
-    input_files = args.input_files
+    if args.stats_memory and not args.stats:
+        parser.error("--stats-memory requires --stats")
+    input_files, num_errors = expand_input_files(args.input_files)
     output_path = args.output
     output_format = args.format
     no_indent = args.no_indent
+    jobs = args.jobs
+    cache = Cache(args.cache_dir, max_size=args.cache_max_size * 1024**2) if args.cache_dir else None
+    deduplicator = Deduplicator() if args.dedupe else None
+    stats = ParseStats(trace_memory=args.stats_memory) if args.stats else None
+
+    with open_output(output_path) as fp, stats.activate() if stats is not None else nullcontext():
+        writer = StatementWriter.for_format(output_format, fp, indent=None if no_indent else 4, sheets=args.sheets)
+        parse: Callable[[str], Any]
+        if cache is not None:
+            parse = cache.parse
+        elif writer.columnar:
+            parse = parse_to_columns
+        else:
+            parse = BankToCustomerStatement.from_file
+        if args.validate:
+            parse = functools.partial(parse, validate_schema=True)
+        if STDIN_PATH in input_files:
+            # stdin can only be read by the main process
+            parse = functools.partial(_parse_or_read_stdin, parse, validate_schema=args.validate)
+            jobs = 1
+
+        for result in map_files(parse, input_files, jobs=jobs):
+            if isinstance(result.value, BankToCustomerStatement):
+                statement = result.value
+                if deduplicator is not None:
+                    with _phase("dedupe", result.path):
+                        statement = deduplicator.filter_statement(statement)
+                with _phase("write", result.path) as phase:
+                    writer.write(statement)
+                    if phase is not None:
+                        phase.entries = len(statement.transactions)
+            elif isinstance(result.value, dict):
+                columns = result.value
+                if deduplicator is not None:
+                    with _phase("dedupe", result.path):
+                        columns = deduplicator.filter_columns(columns)
+                with _phase("write", result.path) as phase:
+                    writer.write_columns(columns)
+                    if phase is not None:
+                        phase.entries = len(columns["statement.id"])
+            else:
+                print(f"okane: error: {result.path}: {result.error}", file=sys.stderr)
+                num_errors += 1
+        with _phase("write"):
+            writer.close()
 
-    statements = [BankToCustomerStatement.from_file(path) for path in input_files]
-
-    output_bytes = b""
-
-    match output_format:
-        case OutputFormat.JSON:
-            for statement in statements:
-                output_bytes += statement.model_dump_json(indent=None if no_indent else 4).encode("utf-8")
-                output_bytes += b"\n"
-        case OutputFormat.CSV:
-            dfs = []
-            for statement in statements:
-                df = statement.as_dataframe()
-                dfs.append(df)
-            assert pd is not None
-            all_df = pd.concat(dfs)
-            buf = StringIO()
-            all_df.to_csv(buf, index=False)
-            output_bytes = buf.getvalue().encode("utf-8")
-        case OutputFormat.XLSX:
-            dfs = []
-            for statement in statements:
-                df = statement.as_dataframe()
-                dfs.append(df)
-            assert pd is not None
-            all_df = pd.concat(dfs)
-            buf_bin = BytesIO()
-            all_df.to_excel(buf_bin, index=False)
-            output_bytes = buf_bin.getvalue()
-        case _:
-            raise NotImplementedError(f"Unsupported output format {output_format}")
-
-    if output_path == "-":
-        sys.stdout.buffer.write(output_bytes)
-    else:
-        with open(output_path, "wb") as fp:
-            fp.write(output_bytes)
+    if cache is not None:
+        cache.close()
+
+    if stats is not None:
+        with open_output(args.stats) if args.stats != "-" else nullcontext(sys.stderr.buffer) as stats_fp:
+            stats_fp.write(json.dumps(stats.to_json(), indent=4).encode("utf-8") + b"\n")
 
-    return 0
+    return 1 if num_errors else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+import os.path as op
+import datetime
+from decimal import Decimal
+
+import pytest
+import okane
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except Exception:
+    pa = None
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+@pytest.mark.skipif(pa is None, reason="requires pyarrow")
+def test_cli_to_parquet(tmp_path):
+    output_path = str(tmp_path / "output.parquet")
+    assert 0 == okane.main([PATH1, PATH2, "-f", "parquet", "-o", output_path])
+
+    f = pq.ParquetFile(output_path)
+    assert f.metadata.num_row_groups == 2
+    assert f.schema_arrow == okane.arrow_schema()
+
+    table = f.read()
+    assert table.num_rows == 8
+    assert table["transaction.amount"][0].as_py() == Decimal("1500")
+    assert table["transaction.val_date"][0].as_py() == datetime.date(2023, 4, 1)
+    assert table["transaction.related_account_id.iban"][7].as_py() == "LT6632xxxxxx"
+    assert table["statement.id"][7].as_py() == "XXX-STATEMENT-ID"
+
+
+@pytest.mark.skipif(pa is None, reason="requires pyarrow")
+def test_cli_to_arrow(tmp_path):
+    output_path = str(tmp_path / "output.arrow")
+    assert 0 == okane.main([PATH1, PATH2, "-f", "arrow", "-o", output_path])
+
+    with pa.ipc.open_stream(output_path) as reader:
+        batches = list(reader)
+
+    assert [b.num_rows for b in batches] == [2, 6]
+    assert batches[1].column("transaction.entry_ref").to_pylist() == [f"XXX-REF-{i}" for i in range(1, 7)]
+
+
+@pytest.mark.skipif(pa is None, reason="requires pyarrow")
+def test_columns_from_statement():
+    statement = okane.BankToCustomerStatement.from_file(PATH2)
+    assert okane.columns_from_statement(statement) == okane.parse_to_columns(PATH2)
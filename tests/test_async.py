@@ -0,0 +1,79 @@
+import asyncio
+import os.path as op
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+@pytest.fixture
+def broken_path(tmp_path):
+    path = tmp_path / "broken.xml"
+    path.write_text("<Document><BkToCstmrStmt>")
+    return str(path)
+
+
+def read_bytes(path):
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
+def test_from_bytes():
+    assert okane.BankToCustomerStatement.from_bytes(read_bytes(PATH2)) == \
+        okane.BankToCustomerStatement.from_file(PATH2)
+
+
+def test_aparse_bytes():
+    async def parse_all():
+        limit = asyncio.Semaphore(2)
+        return await asyncio.gather(*[okane.aparse_bytes(read_bytes(path), limit=limit)
+                                      for path in [PATH1, PATH2, PATH1, PATH2]])
+
+    statements = asyncio.run(parse_all())
+    assert statements == [okane.BankToCustomerStatement.from_file(path) for path in [PATH1, PATH2, PATH1, PATH2]]
+
+
+def test_aparse_bytes_process_pool():
+    async def parse(executor, data):
+        return await okane.aparse_bytes(data, executor=executor)
+
+    with ProcessPoolExecutor(1) as executor:
+        assert asyncio.run(parse(executor, read_bytes(PATH1))) == okane.BankToCustomerStatement.from_file(PATH1)
+        with pytest.raises(RuntimeError, match="XMLSyntaxError"):
+            asyncio.run(parse(executor, b"<Document><BkToCstmrStmt>"))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_aparse_many(ordered, broken_path):
+    paths = [PATH1, broken_path, PATH2]
+
+    async def collect():
+        return [result async for result in okane.aparse_many(paths, jobs=2, ordered=ordered)]
+
+    results = asyncio.run(collect())
+
+    if ordered:
+        assert [r.path for r in results] == paths
+    else:
+        results.sort(key=lambda r: paths.index(r.path))
+    assert results[0].value == okane.BankToCustomerStatement.from_file(PATH1)
+    assert results[1].value is None
+    assert results[1].error is not None
+    assert results[2].value == okane.BankToCustomerStatement.from_file(PATH2)
+
+
+def test_aparse_many_async_paths():
+    async def gen_paths():
+        for path in [PATH1, PATH2]:
+            yield path
+
+    async def collect():
+        return [result async for result in okane.aparse_many(gen_paths(), jobs=1)]
+
+    results = asyncio.run(collect())
+    assert [r.path for r in results] == [PATH1, PATH2]
+    assert all(r.error is None for r in results)
@@ -0,0 +1,53 @@
+import io
+import mmap
+import os.path as op
+import json
+
+import pytest
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+def read_bytes(path):
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
+@pytest.mark.parametrize("make_buffer", [bytes, bytearray, memoryview])
+def test_from_buffer(make_buffer):
+    statement = okane.BankToCustomerStatement.from_buffer(make_buffer(read_bytes(PATH2)))
+    assert statement == okane.BankToCustomerStatement.from_file(PATH2)
+
+
+def test_from_buffer_mmap():
+    with open(PATH2, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        statement = okane.BankToCustomerStatement.from_buffer(buffer)
+    assert statement == okane.BankToCustomerStatement.from_file(PATH2)
+
+
+def test_buffer_reader():
+    data = read_bytes(PATH2)
+    reader = okane.BufferReader(memoryview(data))
+    assert reader.read(5) == data[:5]
+    assert reader.read() == data[5:]
+    assert reader.read(5) == b""
+    assert okane.parse_statement(okane.etree.parse(okane.BufferReader(data)).getroot()) == \
+        okane.BankToCustomerStatement.from_file(PATH2)
+
+
+def test_from_fileobj():
+    statement = okane.BankToCustomerStatement.from_fileobj(io.BytesIO(read_bytes(PATH1)))
+    assert statement == okane.BankToCustomerStatement.from_file(PATH1)
+
+
+def test_cli_stdin(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(read_bytes(PATH2))))
+
+    assert 0 == okane.main([PATH1, "-", "--no-indent", "-j", "2"])
+
+    statements = [okane.BankToCustomerStatement.model_validate(json.loads(line))
+                  for line in capsys.readouterr().out.splitlines()]
+    assert statements == [okane.BankToCustomerStatement.from_file(path) for path in [PATH1, PATH2]]
@@ -0,0 +1,62 @@
+import os.path as op
+import shutil
+
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+def test_cache(tmp_path):
+    path = str(tmp_path / "statement.xml")
+    shutil.copy(PATH2, path)
+
+    with okane.Cache(str(tmp_path / "cache")) as cache:
+        assert cache.get(path) is None
+        statement = cache.parse(path)
+        assert statement == okane.BankToCustomerStatement.from_file(PATH2)
+        assert cache.get(path) == statement
+
+        # same content under different path is a hit
+        path_copy = str(tmp_path / "copy.xml")
+        shutil.copy(PATH2, path_copy)
+        assert cache.get(path_copy) == statement
+
+        # changed content is a miss
+        shutil.copy(PATH1, path)
+        assert cache.get(path) is None
+        assert cache.parse(path) == okane.BankToCustomerStatement.from_file(PATH1)
+
+    # cache persists
+    with okane.Cache(str(tmp_path / "cache")) as cache:
+        assert cache.get(path_copy) == statement
+
+
+def test_cache_eviction(tmp_path):
+    with okane.Cache(str(tmp_path / "cache"), max_size=1) as cache:
+        cache.parse(PATH1)
+        assert cache.get(PATH1) is None
+
+    with okane.Cache(str(tmp_path / "cache2"), max_size=None) as cache:
+        cache.parse(PATH1)
+        cache.parse(PATH2)
+        cache.get(PATH1)
+        size, = cache.connection.execute("SELECT size FROM statements").fetchone()
+        cache.max_size = 2 * size
+        cache.evict()
+        assert cache.get(PATH1) is not None
+        assert cache.get(PATH2) is None
+
+
+def test_parse_many_cached(tmp_path, capsys):
+    cache = okane.Cache(str(tmp_path / "cache"))
+    results = list(okane.parse_many([PATH1, PATH2, PATH1], jobs=2, cache=cache))
+    assert [r.value for r in results] == [okane.BankToCustomerStatement.from_file(p) for p in [PATH1, PATH2, PATH1]]
+    assert cache.get(PATH1) is not None
+    assert cache.get(PATH2) is not None
+    cache.close()
+
+    for _ in range(2):
+        assert 0 == okane.main([PATH1, PATH2, "-f", "csv", "--cache-dir", str(tmp_path / "cache")])
+        assert len(capsys.readouterr().out.splitlines()) == 1 + 2 + 6
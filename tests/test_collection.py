@@ -0,0 +1,46 @@
+import os.path as op
+import datetime
+
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+def test_statement_collection():
+    statements = [okane.BankToCustomerStatement.from_file(path) for path in [PATH1, PATH2]]
+    collection = okane.StatementCollection()
+    for statement in statements:
+        collection.add(statement)
+
+    transactions = [tx for statement in statements for tx in statement.transactions]
+    assert len(collection) == 2
+    assert collection.num_transactions == len(transactions)
+
+    for tx in transactions:
+        assert tx in collection.find_by_entry_ref(tx.entry_ref)
+        if tx.ref.end_to_end_id is not None:
+            assert collection.find_by_end_to_end_id(tx.ref.end_to_end_id) == \
+                [t for t in transactions if t.ref.end_to_end_id == tx.ref.end_to_end_id]
+        if tx.ref.account_servicer_ref is not None:
+            assert tx in collection.find_by_account_servicer_ref(tx.ref.account_servicer_ref)
+        if tx.related_account_id is not None:
+            account = tx.related_account_id.iban or tx.related_account_id.id
+            assert tx in collection.find_by_account(account)
+
+    assert collection.statement_of(statements[1].transactions[0]) is statements[1]
+    assert collection.find_by_entry_ref("no such ref") == []
+
+
+def test_statement_collection_val_date():
+    collection = okane.StatementCollection.from_files([PATH2, PATH1])
+    transactions = [tx for statement in collection for tx in statement.transactions]
+
+    assert collection.find_by_val_date() == sorted(transactions, key=lambda tx: tx.val_date)
+
+    start, end = datetime.date(2023, 3, 5), datetime.date(2023, 3, 20)
+    result = collection.find_by_val_date(start, end)
+    assert result == sorted([tx for tx in transactions if start <= tx.val_date <= end], key=lambda tx: tx.val_date)
+    assert result
+    assert collection.find_by_val_date(end=datetime.date(2000, 1, 1)) == []
@@ -0,0 +1,59 @@
+import os.path as op
+from decimal import Decimal
+
+import pytest
+import okane
+try:
+    import pandas as pd
+except Exception:
+    pd = None
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+def test_parse_transaction_row():
+    statement = okane.BankToCustomerStatement.from_file(PATH2)
+    columns = okane.parse_to_columns(PATH2)
+
+    assert list(columns) == okane.TRANSACTION_COLUMNS + okane.STATEMENT_COLUMNS
+    for i, tx in enumerate(statement.transactions):
+        row = okane.flatten_dict(tx.model_dump(), prefix="transaction.")
+        for name in okane.TRANSACTION_COLUMNS:
+            assert columns[name][i] == row.get(name)
+        assert okane.transaction_from_row(tuple(columns[name][i] for name in okane.TRANSACTION_COLUMNS)) == tx
+
+    assert columns["statement.id"] == ["XXX-STATEMENT-ID"] * 6
+    assert columns["statement.account_id"] == ["XXX-IBAN"] * 6
+
+
+def test_parse_to_columns_minor_units():
+    columns = okane.parse_to_columns(PATH1, minor_units=True)
+    assert columns["transaction.amount"] == [150000, -50000]
+
+
+def test_to_minor_units():
+    assert okane.to_minor_units(Decimal("12.34"), "CZK") == 1234
+    assert okane.to_minor_units(Decimal("-12"), "EUR") == -1200
+    assert okane.to_minor_units(Decimal("1200"), "JPY") == 1200
+    assert okane.to_minor_units(Decimal("1.234"), "BHD") == 1234
+    with pytest.raises(ValueError):
+        okane.to_minor_units(Decimal("1.234"), "CZK")
+
+
+@pytest.mark.skipif(pd is None, reason="requires pandas")
+def test_read_dataframe():
+    df_ref = pd.concat(okane.BankToCustomerStatement.from_file(p).as_dataframe() for p in [PATH1, PATH2])
+    df = okane.read_dataframe([PATH1, PATH2])
+
+    assert list(df.columns) == list(df_ref.columns)
+    assert to_rows(df) == to_rows(df_ref)
+
+    df_minor = okane.read_dataframe(PATH2, minor_units=True)
+    assert df_minor["transaction.amount"].dtype == "int64"
+    assert df_minor["transaction.amount"].tolist() == [-10000, -20000, 100000, 40000, -10000, 100000]
+
+
+def to_rows(df):
+    return [[None if pd.isna(v) else v for v in row] for row in df.values.tolist()]
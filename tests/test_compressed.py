@@ -0,0 +1,99 @@
+import bz2
+import gzip
+import lzma
+import os.path as op
+import pathlib
+import json
+import zipfile
+
+import pytest
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+def read_bytes(path):
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    path = str(tmp_path / "bundle.zip")
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("statements/", "")
+        zf.write(PATH1, "statements/test1.xml")
+        zf.write(PATH2, "statements/test2.XML")
+        zf.writestr("README.txt", "not a statement")
+    return path
+
+
+@pytest.mark.parametrize("suffix, compress", [(".gz", gzip.compress), (".bz2", bz2.compress),
+                                              (".xz", lzma.compress)])
+def test_compressed_file(tmp_path, suffix, compress):
+    path = tmp_path / f"test2.xml{suffix}"
+    path.write_bytes(compress(read_bytes(PATH2)))
+    path = str(path)
+
+    assert not okane.is_plain_path(path)
+    assert okane.expand_input(path) == [path]
+    expected = okane.BankToCustomerStatement.from_file(PATH2)
+    assert okane.BankToCustomerStatement.from_file(path) == expected
+    assert okane.parse_to_columns(path) == okane.parse_to_columns(PATH2)
+    assert okane.summarize_statement(path).closing_balance == okane.summarize_statement(PATH2).closing_balance
+
+
+def test_zip_members(bundle):
+    paths = okane.expand_input(bundle)
+    assert paths == [f"{bundle}::statements/test1.xml", f"{bundle}::statements/test2.XML"]
+
+    opened = [(path, fp.read()) for path, fp in okane.open_statements(bundle)]
+    assert opened == [(paths[0], read_bytes(PATH1)), (paths[1], read_bytes(PATH2))]
+
+    statements = [r.value for r in okane.parse_many(paths, jobs=2)]
+    assert statements == [okane.BankToCustomerStatement.from_file(path) for path in [PATH1, PATH2]]
+
+
+def test_plain_path_with_separator(bundle, tmp_path):
+    path = tmp_path / "stmt::2023.xml"
+    path.write_bytes(read_bytes(PATH1))
+    path = str(path)
+
+    assert okane.split_zip_member(path) == (path, None)
+    assert okane.is_plain_path(path)
+    assert okane.BankToCustomerStatement.from_file(path) == okane.BankToCustomerStatement.from_file(PATH1)
+
+    # only an existing archive is split
+    assert okane.split_zip_member(f"{bundle}::test1.xml") == (bundle, "test1.xml")
+    missing = str(tmp_path / "missing.zip::test1.xml")
+    assert okane.split_zip_member(missing) == (missing, None)
+
+
+def test_cli_zip(bundle, tmp_path, capsys):
+    output = str(tmp_path / "output.jsonl")
+
+    assert 1 == okane.main([bundle, str(tmp_path / "missing.zip"), "-o", output, "--no-indent", "-j", "2"])
+    assert "missing.zip" in capsys.readouterr().err
+
+    with open(output, encoding="utf-8") as fp:
+        statements = [okane.BankToCustomerStatement.model_validate(json.loads(line)) for line in fp]
+    assert statements == [okane.BankToCustomerStatement.from_file(path) for path in [PATH1, PATH2]]
+
+
+def test_cache_zip_member(bundle, tmp_path):
+    cache = okane.Cache(str(tmp_path / "cache"))
+    path = okane.expand_input(bundle)[1]
+    assert cache.parse(path) == okane.BankToCustomerStatement.from_file(PATH2)
+    assert cache.file_digest(path) == okane.sha256_file(PATH2)
+    cache.close()
+
+
+def test_pathlib_path(bundle):
+    expected = okane.BankToCustomerStatement.from_file(PATH1)
+    assert okane.BankToCustomerStatement.from_file(pathlib.Path(PATH1)) == expected
+    assert list(okane.iter_transactions(pathlib.Path(PATH1))) == expected.transactions
+    assert okane.parse_to_columns(pathlib.Path(PATH1)) == okane.parse_to_columns(PATH1)
+    assert okane.summarize_statement(pathlib.Path(PATH1)).path == str(pathlib.Path(PATH1))
+    assert okane.expand_input(pathlib.Path(bundle)) == okane.expand_input(bundle)
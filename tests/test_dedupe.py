@@ -0,0 +1,65 @@
+import os.path as op
+import json
+import random
+
+import pytest
+import okane
+try:
+    import pandas as pd
+except Exception:
+    pd = None
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+def test_fingerprint_set():
+    rng = random.Random(0)
+    values = [rng.getrandbits(64) for _ in range(10000)] + [0, 1, 2, 1 << 63]
+    fingerprints = okane.FingerprintSet(capacity=4)
+
+    assert all(fingerprints.add(v) for v in values)
+    assert not any(fingerprints.add(v) for v in values)
+    assert len(fingerprints) == len(values)
+    assert all(v in fingerprints for v in values)
+    assert 3 not in fingerprints
+
+
+def test_dedupe():
+    statement1 = okane.BankToCustomerStatement.from_file(PATH1)
+    statement2 = okane.BankToCustomerStatement.from_file(PATH2)
+    partial = statement2.model_copy(update={"transactions": statement2.transactions[2:] + statement1.transactions})
+
+    result = list(okane.dedupe([statement2, partial, statement2]))
+
+    assert result[0] == statement2
+    assert result[1].transactions == statement1.transactions
+    assert result[1].closing_balance == partial.closing_balance
+    assert result[2].transactions == []
+
+
+def test_dedupe_columns():
+    deduplicator = okane.Deduplicator()
+    columns1 = deduplicator.filter_columns(okane.parse_to_columns(PATH2))
+    columns2 = deduplicator.filter_columns(okane.parse_to_columns(PATH2))
+
+    assert len(columns1["transaction.amount"]) == 6
+    assert all(len(values) == 0 for values in columns2.values())
+    assert deduplicator.num_duplicates == 6
+
+
+def test_cli_dedupe(capsys):
+    assert 0 == okane.main([PATH2, PATH2, "--no-indent", "--dedupe"])
+    output = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert len(output[0]["transactions"]) == 6
+    assert output[1]["transactions"] == []
+
+
+@pytest.mark.skipif(pd is None, reason="requires pandas")
+def test_cli_dedupe_csv(tmp_path):
+    output = str(tmp_path / "output.csv")
+    assert 0 == okane.main([PATH1, PATH2, PATH1, PATH2, "-f", "csv", "-o", output, "--dedupe"])
+
+    assert len(pd.read_csv(output)) == 8
@@ -0,0 +1,27 @@
+import os.path as op
+import json
+import subprocess
+import sys
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+ROOT = op.join(op.dirname(__file__), "..")
+
+# optional or heavy modules which should only be imported when they are used
+LAZY_MODULES = ["pandas", "numpy", "pyarrow", "openpyxl", "asyncio", "multiprocessing"]
+
+
+def imported_lazy_modules(code):
+    script = f"import json, sys\n{code}\nprint(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def test_import_is_lazy():
+    assert imported_lazy_modules("import okane") == []
+
+
+def test_cli_imports_only_what_it_needs(tmp_path):
+    output = str(tmp_path / "output")
+    assert imported_lazy_modules(f"import okane; okane.main([{PATH1!r}, '-f', 'json', '-o', {output!r}]); "
+                                 f"okane.main([{PATH1!r}, '-f', 'csv', '-o', {output!r}])") == []
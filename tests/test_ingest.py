@@ -0,0 +1,121 @@
+import gzip
+import os
+import os.path as op
+import json
+import shutil
+import zipfile
+from io import BytesIO
+
+import pytest
+import okane
+try:
+    import pandas as pd
+except Exception:
+    pd = None
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+def copy_statement(src, dst, statement_id):
+    with open(src, encoding="utf-8") as fp:
+        dst.write_text(fp.read().replace("<Id>XXX-STATEMENT-ID</Id>", f"<Id>{statement_id}</Id>"), encoding="utf-8")
+
+
+@pytest.fixture
+def inbox(tmp_path):
+    directory = tmp_path / "inbox"
+    (directory / "2023").mkdir(parents=True)
+    copy_statement(PATH1, directory / "2023" / "test1.xml", "2023-001")
+    return directory
+
+
+def read_statement_ids(path):
+    with open(path, encoding="utf-8") as fp:
+        return [json.loads(line)["statement_id"] for line in fp]
+
+
+def test_ingest(tmp_path, inbox, capsys):
+    state = str(tmp_path / "state.db")
+    output = str(tmp_path / "output.jsonl")
+    args = ["ingest", str(inbox), "--state", state, "-o", output, "--no-indent"]
+
+    assert 0 == okane.main(args)
+    assert read_statement_ids(output) == ["2023-001"]
+
+    # nothing new
+    assert 0 == okane.main(args)
+    assert len(read_statement_ids(output)) == 1
+
+    # new file is appended, touched or copied files with known content are skipped
+    copy_statement(PATH2, inbox / "test2.xml", "2023-002")
+    shutil.copy(inbox / "2023" / "test1.xml", inbox / "test1-copy.xml")
+    os.utime(inbox / "2023" / "test1.xml", ns=(0, 0))
+    assert 0 == okane.main(args)
+    assert read_statement_ids(output) == ["2023-001", "2023-002"]
+
+    # changed file with an already ingested statement is skipped with a warning
+    with open(inbox / "test2.xml", encoding="utf-8") as fp:
+        (inbox / "test2-resent.xml").write_text(fp.read().replace("<Ustrd>", "<Ustrd>changed "), encoding="utf-8")
+    assert 0 == okane.main(args)
+    assert len(read_statement_ids(output)) == 2
+    assert "already ingested" in capsys.readouterr().err
+
+
+def test_ingest_compressed_and_zip(tmp_path, inbox):
+    state = str(tmp_path / "state.db")
+    output = str(tmp_path / "output.jsonl")
+    args = ["ingest", str(inbox), "--state", state, "-o", output, "--no-indent"]
+
+    copy_statement(PATH2, tmp_path / "test2.xml", "2023-002")
+    (inbox / "test2.xml.gz").write_bytes(gzip.compress((tmp_path / "test2.xml").read_bytes()))
+    copy_statement(PATH2, tmp_path / "test3.xml", "2023-003")
+    with zipfile.ZipFile(inbox / "bundle.zip", "w") as zf:
+        zf.write(tmp_path / "test3.xml", "test3.xml")
+    (inbox / "notes.txt").write_text("not a statement")
+
+    assert 0 == okane.main(args)
+    assert sorted(read_statement_ids(output)) == ["2023-001", "2023-002", "2023-003"]
+
+    # only files matching the given patterns
+    output = str(tmp_path / "output-xml.jsonl")
+    assert 0 == okane.main(["ingest", str(inbox), "--state", str(tmp_path / "state-xml.db"), "-o", output,
+                            "--no-indent", "--pattern", "*.xml"])
+    assert read_statement_ids(output) == ["2023-001"]
+
+
+def test_ingest_errors_are_retried(tmp_path, inbox, capsys):
+    state = str(tmp_path / "state.db")
+    output = str(tmp_path / "output.jsonl")
+    args = ["ingest", str(inbox), "--state", state, "-o", output, "--no-indent"]
+
+    (inbox / "broken.xml").write_text("<Document><BkToCstmrStmt>")
+    assert 1 == okane.main(args)
+    assert "broken.xml" in capsys.readouterr().err
+    assert 1 == okane.main(args)
+
+    copy_statement(PATH2, inbox / "broken.xml", "2023-002")
+    assert 0 == okane.main(args)
+    assert len(read_statement_ids(output)) == 2
+
+
+@pytest.mark.skipif(pd is None, reason="requires pandas")
+def test_ingest_csv_append(tmp_path, inbox):
+    state = str(tmp_path / "state.db")
+    output = str(tmp_path / "output.csv")
+    args = ["ingest", str(inbox), "--state", state, "-o", output, "-f", "csv"]
+
+    assert 0 == okane.main(args)
+    copy_statement(PATH2, inbox / "test2.xml", "2023-002")
+    assert 0 == okane.main(args)
+
+    df = pd.read_csv(output)
+    expected = pd.concat([okane.BankToCustomerStatement.from_file(path).as_dataframe() for path in [PATH1, PATH2]])
+    assert list(df.columns) == list(expected.columns)
+    assert len(df) == len(expected)
+
+
+def test_cannot_append_parquet():
+    with pytest.raises(ValueError):
+        okane.StatementWriter.for_format(okane.OutputFormat.PARQUET, BytesIO(), append=True)
@@ -0,0 +1,47 @@
+import os.path as op
+
+import pytest
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+@pytest.mark.parametrize("path", [PATH1, PATH2])
+def test_lazy_transactions(path):
+    transactions = okane.BankToCustomerStatement.from_file(path).transactions
+    lazy_transactions = okane.read_transactions_lazy(path)
+
+    assert len(lazy_transactions) == len(transactions)
+    for lazy, tx in zip(lazy_transactions, transactions):
+        for name in okane.Transaction.model_fields:
+            assert getattr(lazy, name) == getattr(tx, name)
+        assert lazy.info == tx.info
+        assert lazy.related_account == tx.related_account
+        assert lazy.to_transaction() == tx
+
+
+def test_lazy_transaction_decodes_only_accessed_fields():
+    tx = okane.read_transactions_lazy(PATH2)[5]
+
+    assert tx.amount == okane.BankToCustomerStatement.from_file(PATH2).transactions[5].amount
+    assert "amount" in tx.__dict__
+    assert "val_date" not in tx.__dict__
+    assert "_details" not in tx.__dict__
+
+    assert tx.related_account is not None
+    assert "_details" in tx.__dict__
+    assert "ref" not in tx.__dict__
+
+
+def test_lazy_transaction_errors_on_access(tmp_path):
+    path = tmp_path / "statement.xml"
+    with open(PATH2, encoding="utf-8") as fp:
+        path.write_text(fp.read().replace("<CdtDbtInd>DBIT</CdtDbtInd>", "<CdtDbtInd>XXX</CdtDbtInd>", 1),
+                        encoding="utf-8")
+
+    tx = okane.read_transactions_lazy(str(path))[0]
+    assert tx.entry_ref
+    with pytest.raises(ValueError):
+        tx.amount
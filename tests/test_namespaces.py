@@ -0,0 +1,34 @@
+import os.path as op
+
+import pytest
+import okane
+
+
+TEST2_PATH = op.join(op.dirname(__file__), "./data/test2.xml")
+CAMT053_001_02 = b'xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02"'
+
+
+@pytest.mark.parametrize("xmlns", [
+    b'xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.04"',
+    b'xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.08"',
+    b'',
+])
+def test_other_versions(tmp_path, xmlns):
+    with open(TEST2_PATH, "rb") as fp:
+        raw_xml = fp.read()
+    assert CAMT053_001_02 in raw_xml
+
+    path = tmp_path / "statement.xml"
+    path.write_bytes(raw_xml.replace(CAMT053_001_02, xmlns))
+
+    statement_ref = okane.BankToCustomerStatement.from_file(TEST2_PATH)
+    statement = okane.BankToCustomerStatement.from_file(str(path))
+    assert statement == statement_ref
+
+    assert okane.read_statement_header(str(path)) == okane.read_statement_header(TEST2_PATH)
+    assert list(okane.iter_transactions(str(path))) == statement_ref.transactions
+
+
+def test_qualify_path():
+    assert okane.qualify_path("Ntry/Amt", None) == "Ntry/Amt"
+    assert okane.qualify_path("Ntry/Amt", "urn:x") == "{urn:x}Ntry/{urn:x}Amt"
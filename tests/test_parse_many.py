@@ -0,0 +1,59 @@
+import os.path as op
+
+import pytest
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+@pytest.fixture
+def broken_path(tmp_path):
+    path = tmp_path / "broken.xml"
+    path.write_text("<Document><BkToCstmrStmt>")
+    return str(path)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_parse_many(jobs, broken_path):
+    paths = [PATH1, broken_path, PATH2, PATH1]
+    results = list(okane.parse_many(paths, jobs=jobs))
+
+    assert [r.path for r in results] == paths
+    assert results[0].value == okane.BankToCustomerStatement.from_file(PATH1)
+    assert results[1].value is None
+    assert results[1].error is not None
+    assert results[2].value == okane.BankToCustomerStatement.from_file(PATH2)
+    assert results[3].value == results[0].value
+
+
+def test_parse_many_unordered():
+    paths = [PATH1, PATH2] * 5
+    results = list(okane.parse_many(paths, jobs=3, ordered=False))
+
+    assert sorted(r.path for r in results) == sorted(paths)
+    assert all(r.error is None for r in results)
+
+
+def test_cli_errors(capsys, broken_path):
+    assert 1 == okane.main([PATH1, broken_path, "--no-indent", "-j", "2"])
+
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 1
+    assert broken_path in captured.err
+
+
+def test_negative_jobs():
+    with pytest.raises(ValueError, match="jobs"):
+        okane.parse_many([PATH1], jobs=-1)
+    with pytest.raises(ValueError, match="jobs"):
+        okane.map_files(okane.summarize_statement, [PATH1], jobs=-2)
+
+
+@pytest.mark.parametrize("args", [[PATH1], ["verify", PATH1], ["ingest", op.dirname(PATH1), "--state", "state.db"]])
+def test_cli_negative_jobs(capsys, args):
+    with pytest.raises(SystemExit) as excinfo:
+        okane.main(args + ["-j", "-1"])
+    assert excinfo.value.code == 2
+    assert "non-negative integer" in capsys.readouterr().err
@@ -0,0 +1,56 @@
+import datetime
+from decimal import Decimal
+
+import okane
+from lxml import etree
+
+
+def test_first_match_wins():
+    ntry = etree.XML("""\
+    <Ntry xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.08">
+        <!-- comment -->
+        <NtryRef> REF-1 </NtryRef>
+        <Amt Ccy="EUR">12.50</Amt>
+        <CdtDbtInd>DBIT</CdtDbtInd>
+        <ValDt><Dt>2023-03-01</Dt></ValDt>
+        <NtryDtls>
+            <TxDtls>
+                <RltdPties>
+                    <CdtrAcct><Id><Othr><Id>CDTR-ACC</Id></Othr></Id></CdtrAcct>
+                </RltdPties>
+                <RltdAgts>
+                    <CdtrAgt><FinInstnId><BICFI>CDTRBIC</BICFI></FinInstnId></CdtrAgt>
+                </RltdAgts>
+            </TxDtls>
+            <TxDtls>
+                <Refs><EndToEndId>E2E-2</EndToEndId><EndToEndId>E2E-3</EndToEndId></Refs>
+                <RmtInf><Ustrd>info 2</Ustrd></RmtInf>
+                <RltdPties>
+                    <DbtrAcct><Id><IBAN>DBTR-IBAN</IBAN></Id></DbtrAcct>
+                </RltdPties>
+            </TxDtls>
+        </NtryDtls>
+        <NtryDtls>
+            <TxDtls>
+                <RmtInf><Ustrd>info 3</Ustrd></RmtInf>
+                <AddtlTxInf>additional 3</AddtlTxInf>
+            </TxDtls>
+        </NtryDtls>
+    </Ntry>""")
+
+    tx = okane.parse_transaction(ntry)
+    assert tx.entry_ref == "REF-1"
+    assert tx.amount == Decimal("-12.50")
+    assert tx.currency == "EUR"
+    assert tx.val_date == datetime.date(2023, 3, 1)
+    assert tx.ref == okane.TransactionRef(end_to_end_id="E2E-2")
+    assert tx.remote_info == "info 2"
+    assert tx.additional_transaction_info == "additional 3"
+    assert tx.related_account_id == okane.AccountId(iban="DBTR-IBAN")
+    assert tx.related_account_bank_id == okane.BankId(bic="CDTRBIC")
+
+
+def test_account_and_bank_id():
+    assert okane.AccountId.from_xml(etree.XML("<Id><Othr><Id>123</Id></Othr></Id>")) == okane.AccountId(id="123")
+    assert okane.AccountId.from_xml(etree.XML("<Id><Othr/></Id>")) is None
+    assert okane.BankId.from_xml(etree.XML("<FinInstnId><BIC>X</BIC><BICFI>Y</BICFI></FinInstnId>")) == okane.BankId(bic="X")
@@ -0,0 +1,152 @@
+import os.path as op
+
+import pytest
+from lxml import etree
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+PATH_TWO_STATEMENTS = op.join(op.dirname(__file__), "./data/test_two_statements.xml")
+
+# stand-in for the official camt.053.001.02 schema: `BkToCstmrStmt` with `GrpHdr` and `Stmt` elements
+SCHEMA = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" elementFormDefault="qualified"
+           xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02"
+           targetNamespace="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02">
+    <xs:complexType name="Any">
+        <xs:sequence>
+            <xs:any processContents="skip" minOccurs="0" maxOccurs="unbounded"/>
+        </xs:sequence>
+    </xs:complexType>
+    <xs:element name="Document">
+        <xs:complexType>
+            <xs:sequence>
+                <xs:element name="BkToCstmrStmt">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="GrpHdr" type="Any"/>
+                            <xs:element name="Stmt" type="Any" maxOccurs="unbounded"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:sequence>
+        </xs:complexType>
+    </xs:element>
+</xs:schema>
+"""
+
+
+@pytest.fixture
+def schema_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "schemas"
+    directory.mkdir()
+    (directory / "camt.053.001.02.xsd").write_text(SCHEMA, encoding="utf-8")
+    monkeypatch.setenv(okane.SCHEMA_DIR_ENV, str(directory))
+    return directory
+
+
+@pytest.fixture
+def invalid_path(tmp_path):
+    path = tmp_path / "invalid.xml"
+    with open(PATH1, encoding="utf-8") as fp:
+        path.write_text(fp.read().replace("</BkToCstmrStmt>", "<Unexpected/></BkToCstmrStmt>"), encoding="utf-8")
+    return str(path)
+
+
+def test_validate_schema(schema_dir, invalid_path):
+    statement = okane.BankToCustomerStatement.from_file(PATH1, validate_schema=True)
+    assert statement == okane.BankToCustomerStatement.from_file(PATH1)
+    assert okane.parse_to_columns(PATH1, validate_schema=True) == okane.parse_to_columns(PATH1)
+
+    # the unexpected element is ignored without validation
+    okane.BankToCustomerStatement.from_file(invalid_path)
+    with pytest.raises(etree.DocumentInvalid, match="Unexpected"):
+        okane.BankToCustomerStatement.from_file(invalid_path, validate_schema=True)
+    with pytest.raises(etree.XMLSyntaxError, match="Unexpected"):
+        okane.parse_to_columns(invalid_path, validate_schema=True)
+
+
+def test_validate_schema_after_first_statement(schema_dir, tmp_path):
+    # only the first statement is parsed, but the whole document must be validated
+    path = tmp_path / "invalid.xml"
+    with open(PATH_TWO_STATEMENTS, encoding="utf-8") as fp:
+        path.write_text(fp.read().replace("</BkToCstmrStmt>", "<Unexpected/></BkToCstmrStmt>"), encoding="utf-8")
+
+    assert okane.parse_to_columns(PATH_TWO_STATEMENTS, validate_schema=True) == okane.parse_to_columns(PATH1)
+    with pytest.raises(etree.XMLSyntaxError, match="Unexpected"):
+        okane.parse_to_columns(str(path), validate_schema=True)
+
+
+def test_schema_is_compiled_once(schema_dir):
+    okane.load_schema("urn:iso:std:iso:20022:tech:xsd:camt.053.001.02")
+    misses = okane._load_schema.cache_info().misses
+    for path in [PATH1, PATH2, PATH1]:
+        okane.BankToCustomerStatement.from_file(path, validate_schema=True)
+    assert okane._load_schema.cache_info().misses == misses
+
+
+@pytest.mark.parametrize("version", range(1, 15))
+def test_bundled_schemas(monkeypatch, version):
+    monkeypatch.delenv(okane.SCHEMA_DIR_ENV, raising=False)
+    namespace = f"urn:iso:std:iso:20022:tech:xsd:camt.053.001.{version:02}"
+    assert okane.schema_path(namespace).startswith(okane.BUNDLED_SCHEMA_DIR)
+    assert okane.load_schema(namespace) is not None
+
+
+def test_validate_bundled_schema(monkeypatch):
+    monkeypatch.delenv(okane.SCHEMA_DIR_ENV, raising=False)
+    # test data is anonymized with placeholders which the ISO 20022 schema does not accept
+    with pytest.raises(etree.DocumentInvalid, match="XXX-IBAN"):
+        okane.BankToCustomerStatement.from_file(PATH1, validate_schema=True)
+
+
+def test_missing_schema(tmp_path, monkeypatch):
+    monkeypatch.setenv(okane.SCHEMA_DIR_ENV, str(tmp_path))
+    with pytest.raises(FileNotFoundError, match="camt.053.001.02.xsd"):
+        okane.BankToCustomerStatement.from_file(PATH1, validate_schema=True)
+
+
+@pytest.mark.parametrize("args", [[], ["-f", "csv"], ["-j", "2"]])
+def test_cli_validate(schema_dir, invalid_path, tmp_path, capsys, args):
+    output = str(tmp_path / "output")
+
+    assert 0 == okane.main([PATH1, invalid_path, "-o", output] + args)
+    assert 1 == okane.main([PATH1, invalid_path, "-o", output, "--validate"] + args)
+    assert "invalid.xml" in capsys.readouterr().err
+
+
+def test_cache_remembers_valid_files(schema_dir, invalid_path, tmp_path, monkeypatch):
+    with okane.Cache(str(tmp_path / "cache")) as cache:
+        cache.parse(PATH1)
+        assert not cache.is_valid(PATH1)
+        statement = cache.parse(PATH1, validate_schema=True)
+        assert cache.is_valid(PATH1)
+
+        def validate_tree(*args):
+            raise AssertionError("validated again")
+        monkeypatch.setattr(okane, "validate_tree", validate_tree)
+        assert cache.parse(PATH1, validate_schema=True) == statement
+        monkeypatch.undo()
+        monkeypatch.setenv(okane.SCHEMA_DIR_ENV, str(schema_dir))
+
+        cache.parse(invalid_path)
+        for _ in range(2):
+            with pytest.raises(etree.DocumentInvalid, match="Unexpected"):
+                cache.parse(invalid_path, validate_schema=True)
+        assert not cache.is_valid(invalid_path)
+
+
+@pytest.mark.parametrize("namespace", ["urn:../../../../../../tmp/evil/x",
+                                       "urn:iso:std:iso:20022:tech:xsd:camt.053.001.02/../../x",
+                                       "urn:iso:std:iso:20022:tech:xsd:pain.001.001.03"])
+def test_schema_path_rejects_other_namespaces(tmp_path, namespace):
+    with pytest.raises(ValueError, match="not a camt.053 namespace"):
+        okane.schema_path(namespace)
+
+    path = tmp_path / "statement.xml"
+    with open(PATH1, encoding="utf-8") as fp:
+        path.write_text(fp.read().replace("urn:iso:std:iso:20022:tech:xsd:camt.053.001.02", namespace),
+                        encoding="utf-8")
+    with pytest.raises(ValueError, match="not a camt.053 namespace"):
+        okane.BankToCustomerStatement.from_file(str(path), validate_schema=True)
@@ -0,0 +1,85 @@
+import os.path as op
+import json
+
+import pytest
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+def test_stats_phases():
+    stats = okane.ParseStats()
+    okane.BankToCustomerStatement.from_file(PATH1)
+    assert stats.records == []
+
+    with stats.activate():
+        statement = okane.BankToCustomerStatement.from_file(PATH1)
+        okane.parse_to_columns(PATH2)
+
+    assert [(r.phase, r.path) for r in stats.records] == [("parse", PATH1), ("transactions", PATH1),
+                                                          ("parse_to_columns", PATH2)]
+    parse, transactions, columns = stats.records
+    assert parse.bytes_read == op.getsize(PATH1)
+    assert transactions.entries == len(statement.transactions)
+    assert columns.bytes_read == op.getsize(PATH2)
+    assert columns.entries == 6
+    assert all(r.wall_time > 0 and r.peak_memory is None for r in stats.records)
+
+    totals = stats.totals()
+    assert totals["parse"]["count"] == 1
+    assert totals["transactions"]["entries"] == len(statement.transactions)
+
+
+def test_stats_nested_peak_memory():
+    records = []
+    stats = okane.ParseStats(callback=records.append, trace_memory=True)
+
+    with stats.activate():
+        with stats.phase("outer"):
+            data = bytearray(1_000_000)
+            del data
+            with stats.phase("inner"):
+                pass
+
+    inner, outer = records
+    assert inner.peak_memory < 1_000_000
+    assert outer.peak_memory >= 1_000_000
+    assert stats.records == records
+
+
+def test_stats_from_workers():
+    stats = okane.ParseStats()
+    with stats.activate():
+        results = list(okane.parse_many([PATH1, PATH2], jobs=2))
+
+    assert all(r.stats is None for r in results)
+    assert sorted((r.phase, r.path) for r in stats.records) == sorted(
+        (phase, path) for phase in ["parse", "transactions"] for path in [PATH1, PATH2])
+
+
+def test_cli_stats(tmp_path):
+    path = str(tmp_path / "stats.json")
+
+    assert 0 == okane.main([PATH1, PATH2, "-o", str(tmp_path / "output.json"), "--stats", path])
+
+    with open(path, encoding="utf-8") as fp:
+        data = json.load(fp)
+    assert data["totals"]["parse"]["bytes_read"] == op.getsize(PATH1) + op.getsize(PATH2)
+    assert data["totals"]["write"]["entries"] == 8
+    assert [r["phase"] for r in data["records"] if r["path"] == PATH2] == ["parse", "transactions", "write"]
+
+
+def test_cli_stats_does_not_take_input_file(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        okane.main(["--stats", PATH1])
+    with pytest.raises(SystemExit):
+        okane.main([PATH1, "--stats-memory"])
+    assert "--stats-memory requires --stats" in capsys.readouterr().err
+
+    # --stats always takes a value, so it cannot swallow an input file
+    before = op.getmtime(PATH1)
+    assert 0 == okane.main(["--stats", "-", PATH1, "-o", str(tmp_path / "output.json")])
+    assert op.getmtime(PATH1) == before
+    assert json.loads(capsys.readouterr().err)["totals"]["parse"]["count"] == 1
@@ -0,0 +1,42 @@
+import os.path as op
+
+import okane
+
+
+def test_iter_transactions():
+    for name in ["test1.xml", "test2.xml"]:
+        path = op.join(op.dirname(__file__), "./data", name)
+
+        statement = okane.BankToCustomerStatement.from_file(path)
+        transactions = list(okane.iter_transactions(path))
+
+        assert transactions == statement.transactions
+
+
+def test_read_statement_header():
+    for name in ["test1.xml", "test2.xml"]:
+        path = op.join(op.dirname(__file__), "./data", name)
+
+        statement = okane.BankToCustomerStatement.from_file(path)
+        header = okane.read_statement_header(path)
+
+        assert isinstance(header, okane.StatementHeader)
+        assert header.model_dump() == statement.model_dump(exclude={"transactions"})
+
+
+def test_iter_transactions_is_lazy():
+    path = op.join(op.dirname(__file__), "./data/test2.xml")
+
+    it = okane.iter_transactions(path)
+    assert next(it).entry_ref == "XXX-REF-1"
+    assert next(it).entry_ref == "XXX-REF-2"
+    it.close()
+
+
+def test_iter_transactions_reads_first_statement():
+    path = op.join(op.dirname(__file__), "./data/test_two_statements.xml")
+
+    statement = okane.BankToCustomerStatement.from_file(path)
+    assert len(statement.transactions) == 2
+    assert list(okane.iter_transactions(path)) == statement.transactions
+    assert list(okane.TransactionTable.from_file(path)) == statement.transactions
@@ -0,0 +1,64 @@
+import os.path as op
+import datetime
+from decimal import Decimal
+
+import pytest
+import okane
+try:
+    import pandas as pd
+except Exception:
+    pd = None
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+
+@pytest.mark.parametrize("path", [PATH1, PATH2])
+def test_transaction_table(path):
+    transactions = okane.BankToCustomerStatement.from_file(path).transactions
+    table = okane.TransactionTable.from_file(path)
+
+    assert len(table) == len(transactions)
+    assert list(table) == transactions
+    assert table[-1] == transactions[-1]
+    assert list(table[1:4]) == transactions[1:4]
+    assert list(table[::2]) == transactions[::2]
+    assert list(okane.TransactionTable.from_transactions(transactions)) == transactions
+
+
+def test_transaction_table_storage():
+    table = okane.TransactionTable.from_file(PATH2)
+
+    assert table.amounts.typecode == "q"
+    assert table.val_dates.typecode == "i"
+    assert table.dictionaries["transaction.currency"] == ["CZK"]
+    assert set(table.codes["transaction.currency"]) == {0}
+    assert table.amounts[0] == -10000
+    assert table.val_dates[0] == (datetime.date(2023, 3, 1) - datetime.date(1970, 1, 1)).days
+
+
+def test_transaction_table_invalid_amount():
+    row = list(okane.TransactionTable.from_file(PATH2).row(0))
+    row[okane.TRANSACTION_COLUMNS.index("transaction.amount")] = Decimal("1.001")
+
+    with pytest.raises(ValueError):
+        okane.TransactionTable().append_row(tuple(row))
+
+
+@pytest.mark.skipif(pd is None, reason="requires pandas")
+def test_transaction_table_to_pandas():
+    import numpy as np
+
+    table = okane.TransactionTable.from_file(PATH2)
+    df = table.to_pandas()
+    expected = okane.read_dataframe(PATH2, minor_units=True)
+
+    assert list(df.columns) == okane.TRANSACTION_COLUMNS
+    assert np.shares_memory(df["transaction.amount"].to_numpy(), table.to_numpy()["transaction.amount"])
+    for name in okane.TRANSACTION_COLUMNS:
+        if name == "transaction.val_date":
+            assert list(df[name].dt.date) == list(expected[name])
+        else:
+            assert [None if pd.isna(v) else v for v in df[name]] == \
+                [None if pd.isna(v) else v for v in expected[name]]
@@ -0,0 +1,21 @@
+import os.path as op
+import glob
+
+import pytest
+import okane
+
+
+PATHS = sorted(glob.glob(op.join(op.dirname(__file__), "./data/*.xml")))
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_trusted_mode_matches(path):
+    statement = okane.BankToCustomerStatement.from_file(path)
+    statement_trusted = okane.BankToCustomerStatement.from_file(path, validate=False)
+
+    assert statement_trusted == statement
+    assert statement_trusted.model_dump_json() == statement.model_dump_json()
+    assert statement_trusted.model_fields_set == statement.model_fields_set
+    for tx_trusted, tx in zip(statement_trusted.transactions, statement.transactions, strict=True):
+        assert tx_trusted.model_fields_set == tx.model_fields_set
+        assert tx_trusted.ref.model_fields_set == tx.ref.model_fields_set
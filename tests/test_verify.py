@@ -0,0 +1,79 @@
+import os.path as op
+import datetime
+import json
+
+import okane
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+
+TZ = datetime.timezone(datetime.timedelta(hours=1))
+
+
+def make_summary(statement_id, from_date, to_date, opening, closing, total, account_id="CZ01"):
+    return okane.StatementSummary(
+        statement_id=statement_id,
+        account_id=account_id,
+        from_time=datetime.datetime.combine(from_date, datetime.time(0, 0), TZ),
+        to_time=datetime.datetime.combine(to_date, datetime.time(23, 59, 59), TZ),
+        currency="CZK",
+        opening_balance=opening,
+        closing_balance=closing,
+        total=total,
+        num_transactions=1,
+    )
+
+
+def test_summarize_statement():
+    summary = okane.summarize_statement(PATH2)
+    statement = okane.BankToCustomerStatement.from_file(PATH2)
+
+    assert summary == okane.StatementSummary.from_statement(statement, path=PATH2)
+    assert summary.opening_balance == 100000
+    assert summary.closing_balance == 200000
+    assert summary.total == sum(int(tx.amount * 100) for tx in statement.transactions)
+    assert summary.num_transactions == 6
+
+
+def test_verify_statements():
+    d = datetime.date
+    summaries = [
+        make_summary("3", d(2023, 3, 1), d(2023, 3, 31), 300, 350, 50),
+        make_summary("1", d(2023, 1, 1), d(2023, 1, 31), 100, 200, 100),
+        make_summary("2", d(2023, 2, 1), d(2023, 2, 28), 200, 300, 90),
+        make_summary("4", d(2023, 5, 1), d(2023, 5, 31), 360, 360, 0),
+        make_summary("5", d(2023, 5, 15), d(2023, 6, 30), 360, 360, 0),
+        make_summary("5", d(2023, 5, 15), d(2023, 6, 30), 360, 360, 0),
+        make_summary("1", d(2023, 1, 1), d(2023, 1, 31), 0, 0, 0, account_id="CZ02"),
+    ]
+
+    issues = okane.verify_statements(summaries)
+
+    assert [(issue.kind, issue.account_id, issue.statement_ids, issue.difference) for issue in issues] == [
+        (okane.IssueKind.BALANCE_MISMATCH, "CZ01", ("2",), 10),
+        (okane.IssueKind.GAP, "CZ01", ("3", "4"), None),
+        (okane.IssueKind.DISCONTINUITY, "CZ01", ("3", "4"), 10),
+        (okane.IssueKind.OVERLAP, "CZ01", ("4", "5"), None),
+        (okane.IssueKind.DUPLICATE, "CZ01", ("5",), None),
+    ]
+
+
+def test_verify_consistent_statements():
+    statement = okane.BankToCustomerStatement.from_file(PATH2)
+    total = sum(tx.amount for tx in statement.transactions)
+    fixed = statement.model_copy(update={
+        "closing_balance": statement.opening_balance.model_copy(update={"amount": statement.opening_balance.amount + total}),
+    })
+
+    assert okane.verify_statements([fixed]) == []
+    assert [issue.kind for issue in okane.verify_statements([statement])] == [okane.IssueKind.BALANCE_MISMATCH]
+
+
+def test_cli_verify(capsys):
+    assert 1 == okane.main(["verify", PATH1, PATH2, "--json"])
+    issues = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert {issue["kind"] for issue in issues} >= {"duplicate"}
+    assert all(issue["account_id"] == "XXX-IBAN" for issue in issues)
+    assert all(issue["paths"] for issue in issues)
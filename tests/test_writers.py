@@ -0,0 +1,118 @@
+import csv
+import datetime
+import json
+import os.path as op
+from io import BytesIO
+
+import pytest
+import okane
+try:
+    import pandas as pd
+except Exception:
+    pd = None
+try:
+    import openpyxl
+except Exception:
+    openpyxl = None
+
+
+PATH1 = op.join(op.dirname(__file__), "./data/test1.xml")
+PATH2 = op.join(op.dirname(__file__), "./data/test2.xml")
+PATH_TWO_STATEMENTS = op.join(op.dirname(__file__), "./data/test_two_statements.xml")
+
+
+def test_json_writer_is_incremental():
+    statement1 = okane.BankToCustomerStatement.from_file(PATH1)
+    statement2 = okane.BankToCustomerStatement.from_file(PATH2)
+
+    fp = BytesIO()
+    writer = okane.StatementWriter.for_format(okane.OutputFormat.JSON, fp)
+    writer.write(statement1)
+    assert fp.getvalue() == statement1.model_dump_json().encode("utf-8") + b"\n"
+    writer.write(statement2)
+    writer.close()
+    assert len(fp.getvalue().splitlines()) == 2
+
+
+def test_ndjson_writer():
+    statement1 = okane.BankToCustomerStatement.from_file(PATH1)
+    statement2 = okane.BankToCustomerStatement.from_file(PATH2)
+
+    fp = BytesIO()
+    writer = okane.StatementWriter.for_format(okane.OutputFormat.NDJSON, fp)
+    writer.write(statement1)
+    writer.write(statement2)
+    writer.close()
+
+    records = [json.loads(line) for line in fp.getvalue().splitlines()]
+    assert len(records) == len(statement1.transactions) + len(statement2.transactions)
+    assert records[0]["statement"] == {"id": statement1.statement_id, "account_id": "XXX-IBAN"}
+    assert records[0]["transaction"] == json.loads(statement1.transactions[0].model_dump_json())
+    assert [okane.Transaction.model_validate(r["transaction"]) for r in records[-len(statement2.transactions):]] == \
+        statement2.transactions
+
+
+def test_csv_writer_columns():
+    fp = BytesIO()
+    writer = okane.StatementWriter.for_format(okane.OutputFormat.CSV, fp)
+    writer.write(okane.BankToCustomerStatement.from_file(PATH1))
+    header = fp.getvalue().decode("utf-8").splitlines()[0]
+    writer.write(okane.BankToCustomerStatement.from_file(PATH2))
+    writer.close()
+
+    lines = fp.getvalue().decode("utf-8").splitlines()
+    assert header.split(",") == okane.TRANSACTION_COLUMNS + okane.STATEMENT_COLUMNS
+    assert len(lines) == 1 + 2 + 6
+    assert lines.count(header) == 1
+
+
+def test_cli_csv_matches_json_two_statements(tmp_path):
+    # CSV output is written from columns (`parse_to_columns()`), JSON output from the statement model
+    csv_path, json_path = str(tmp_path / "output.csv"), str(tmp_path / "output.json")
+    assert 0 == okane.main([PATH_TWO_STATEMENTS, "-f", "csv", "-o", csv_path])
+    assert 0 == okane.main([PATH_TWO_STATEMENTS, "-o", json_path])
+
+    with open(json_path, encoding="utf-8") as fp:
+        statement = okane.BankToCustomerStatement.model_validate_json(fp.read())
+    with open(csv_path, encoding="utf-8", newline="") as fp:
+        rows = list(csv.DictReader(fp))
+
+    assert len(rows) == len(statement.transactions) == 2
+    assert [row["transaction.entry_ref"] for row in rows] == [tx.entry_ref for tx in statement.transactions]
+    assert {row["statement.id"] for row in rows} == {statement.statement_id}
+    assert {row["statement.account_id"] for row in rows} == {str(statement.account_id)}
+
+
+@pytest.mark.skipif(pd is None, reason="requires pandas")
+def test_csv_writer_matches_dataframe():
+    statement = okane.BankToCustomerStatement.from_file(PATH1)
+    fp = BytesIO()
+    writer = okane.StatementWriter.for_format(okane.OutputFormat.CSV, fp)
+    writer.write(statement)
+    writer.close()
+
+    assert fp.getvalue().decode("utf-8") == statement.as_dataframe().to_csv(index=False)
+
+
+@pytest.mark.skipif(openpyxl is None, reason="requires openpyxl")
+def test_xlsx_writer_sheets():
+    columns1 = okane.parse_to_columns(PATH1)
+    columns2 = okane.parse_to_columns(PATH2)
+    columns2["statement.id"] = ["2023/002"] * len(columns2["statement.id"])
+
+    fp = BytesIO()
+    writer = okane.StatementWriter.for_format(okane.OutputFormat.XLSX, fp, sheets=okane.XlsxSheets.STATEMENT)
+    writer.max_rows = 4
+    writer.write_columns(columns1)
+    writer.write_columns(columns2)
+    writer.close()
+
+    workbook = openpyxl.load_workbook(fp)
+    assert workbook.sheetnames == ["XXX-STATEMENT-ID", "2023_002", "2023_002 (2)"]
+    rows = [list(workbook[name].values) for name in workbook.sheetnames]
+    assert all(sheet[0] == tuple(okane.TRANSACTION_COLUMNS + okane.STATEMENT_COLUMNS) for sheet in rows)
+    assert [len(sheet) - 1 for sheet in rows] == [2, 3, 3]
+
+    amount, val_date = rows[1][1][9:12:2]
+    assert isinstance(amount, (int, float))
+    assert isinstance(val_date, datetime.datetime)